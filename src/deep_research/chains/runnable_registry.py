@@ -0,0 +1,91 @@
+"""Registry of Tool-Bound and Structured-Output Runnables.
+
+``bind_tools`` and ``with_structured_output`` convert every tool or schema to the
+provider's JSON schema format each time they are called. The research loop calls them on
+every iteration with the same model and tools, so this module builds each runnable once
+per (model, tool set, schema, options) and reuses it.
+
+Models and tools are keyed by identity: tools rediscovered after an MCP server restart
+are new objects and get a new runnable. The registry keeps a reference to the objects
+of each key so their ids cannot be reused while the entry is alive.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Sequence
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.runnables import Runnable
+
+from deep_research.consts import runnable_registry_max_entries
+
+# key -> (objects referenced by the key, runnable), least recently used first
+_runnables: OrderedDict[tuple, tuple[tuple, Runnable]] = OrderedDict()
+_lock = threading.Lock()
+_hits = 0
+_misses = 0
+
+
+def _get_or_build(key: tuple, referenced: tuple, build) -> Runnable:
+    global _hits, _misses
+    with _lock:
+        entry = _runnables.get(key)
+        if entry is not None:
+            _runnables.move_to_end(key)
+            _hits += 1
+            return entry[1]
+        _misses += 1
+
+    runnable = build()
+    with _lock:
+        # Keep the runnable of a concurrent builder so every caller shares a single instance
+        entry = _runnables.setdefault(key, (referenced, runnable))
+        while len(_runnables) > runnable_registry_max_entries:
+            _runnables.popitem(last=False)
+        return entry[1]
+
+
+def get_model_with_tools(model: BaseChatModel, tools: Sequence[Any], **kwargs) -> Runnable:
+    """Return ``model.bind_tools(tools, **kwargs)``, built once per model, tool set and options.
+
+    Args:
+        model: Chat model to bind the tools to
+        tools: Tools to bind, in binding order
+        **kwargs: Extra ``bind_tools`` options, e.g. ``tool_choice``
+
+    Returns:
+        Model runnable with the tools bound
+    """
+    tools = tuple(tools)
+    key = ("tools", id(model), tuple(id(tool) for tool in tools), tuple(sorted(kwargs.items())))
+    return _get_or_build(key, (model, tools), lambda: model.bind_tools(list(tools), **kwargs))
+
+
+def get_structured_model(model: BaseChatModel, schema: Any, **kwargs) -> Runnable:
+    """Return ``model.with_structured_output(schema, **kwargs)``, built once per model, schema and options.
+
+    Args:
+        model: Chat model producing the structured output
+        schema: Pydantic model, TypedDict or JSON schema of the output
+        **kwargs: Extra ``with_structured_output`` options, e.g. ``method``
+
+    Returns:
+        Model runnable returning instances of ``schema``
+    """
+    key = ("structured", id(model), id(schema), tuple(sorted(kwargs.items())))
+    return _get_or_build(key, (model, schema), lambda: model.with_structured_output(schema, **kwargs))
+
+
+def registry_stats() -> dict:
+    """Return the number of cached runnables and the registry hit/miss counters."""
+    with _lock:
+        return {"entries": len(_runnables), "hits": _hits, "misses": _misses}
+
+
+def clear_registry() -> None:
+    """Drop every cached runnable and reset the counters."""
+    global _hits, _misses
+    with _lock:
+        _runnables.clear()
+        _hits = 0
+        _misses = 0
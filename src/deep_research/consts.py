@@ -4,5 +4,135 @@
 max_researcher_iterations = 6  # Calls to think_tool + ConductResearch
 
 # Maximum number of concurrent research agents the supervisor can launch
-# This is passed to the lead_researcher_prompt to limit parallel research tasks
+# This is passed to the lead_researcher_prompt to limit parallel research tasks, and enforced by the
+# researcher scheduler (overridable per run with the "max_concurrent_researchers" configurable)
 max_concurrent_researchers = 3
+
+# Maximum number of researchers running at the same time across all runs of the process
+max_concurrent_researchers_per_process = 8
+
+# Deadline (in seconds) of a single researcher launched by the supervisor, and whether a researcher
+# hitting it returns its findings so far, compressed. Overridable per run with the configurable keys
+# "researcher_deadline_seconds" and "researcher_partial_findings"
+researcher_deadline_seconds = 600
+researcher_partial_findings = True
+
+# Maximum duration (in seconds) of the compression of the partial findings of a researcher stopped at its deadline
+researcher_partial_compression_seconds = 60
+
+# Attempts of a researcher failing with an exception, and base / maximum delay (in seconds) of the
+# exponential backoff between attempts. Overridable per run with the configurable keys
+# "researcher_max_attempts" and "researcher_retry_base_delay"
+researcher_max_attempts = 3
+researcher_retry_base_delay = 2.0
+researcher_retry_max_delay = 30.0
+
+# Number of worker processes of the "process_pool" and "queue" researcher backends (see RESEARCHER_BACKEND in app_config.ini)
+researcher_backend_workers = 4
+
+# Time (in seconds) added to the longest duration of a researcher job before a backend stops waiting for its worker
+researcher_backend_timeout_margin = 60
+
+# Overlap (IDF-weighted share of terms, in [0, 1]) between a new ConductResearch topic and a topic already
+# researched in the run above which the earlier findings are reused instead of launching a researcher.
+# Overridable per run with the "topic_reuse_threshold" configurable
+topic_reuse_threshold = 0.8
+
+# Maximum number of search queries sent at once by the async Tavily client
+max_concurrent_search_queries = 5
+
+# Timeout (in seconds) applied to each individual async search query
+search_query_timeout = 30
+
+# Maximum number of webpage summarization calls running at the same time
+max_concurrent_summarizations = 5
+
+# Bounds of the persistent webpage summary cache, least recently used entries are evicted first
+summary_cache_max_entries = 10000
+summary_cache_max_bytes = 200 * 1024 * 1024
+
+# Seconds a summary cache access waits for a lock held by another process before failing
+summary_cache_busy_timeout = 5
+
+# Time-to-live (in seconds) of cached search responses per search topic
+search_cache_ttl_seconds = {"news": 15 * 60, "finance": 60 * 60, "general": 24 * 60 * 60}
+
+# Maximum number of search responses kept by the search cache
+search_cache_max_entries = 1000
+
+# Token budget of a single chunk sent to the summarization model, and maximum number of chunks per page.
+# Pages over the budget are summarized chunk by chunk and the partial summaries are merged.
+summarization_chunk_tokens = 8000
+summarization_max_chunks = 4
+
+# Number of worker processes used for webpage cleanup, and minimum page size (in characters) sent to them
+preprocessing_max_workers = 2
+preprocessing_process_pool_min_chars = 50000
+
+# Near-duplicate page detection: MinHash signature size, word shingle length, number of words
+# considered per page, and estimated Jaccard similarity above which two pages are duplicates
+minhash_num_permutations = 64
+shingle_size = 5
+near_duplicate_max_words = 20000
+near_duplicate_threshold = 0.8
+
+# Lexical relevance pre-filter: BM25 parameters, number of words scored per page, and normalized
+# score below which a search result uses its search snippet instead of a full summarization
+bm25_k1 = 1.2
+bm25_b = 0.75
+relevance_max_words = 20000
+relevance_threshold = 0.1
+
+# Two-phase search: fetch snippets first, then raw content only for the two_phase_top_k most relevant results
+two_phase_search = False
+two_phase_top_k = 2
+
+# Maximum number of tool calls from a single model turn executed at the same time by a researcher
+max_concurrent_tool_calls = 4
+
+# Maximum number of MCP tool calls (e.g. file reads) executed at the same time by a researcher
+max_concurrent_mcp_tool_calls = 4
+
+# MCP session pool: number of warm sessions, and interval / timeout (in seconds) of the health-check ping
+mcp_pool_size = 2
+mcp_health_check_interval = 30
+mcp_health_check_timeout = 5
+
+# Local document index: lines per indexed passage, indexed file extensions, passages returned
+# per search, and maximum number of lines returned by a single read_file_range call
+local_passage_lines = 20
+local_document_extensions = (".md", ".txt", ".rst", ".csv", ".json", ".html")
+local_search_max_results = 5
+local_read_max_lines = 200
+
+# Minimum interval (in seconds) between two scans of the local documents directory for changed files
+local_index_refresh_interval = 60
+
+# Local vector retrieval: number of hash buckets of the passage feature vectors, and minimum
+# cosine similarity for a passage to be returned
+vector_dimensions = 4096
+vector_min_score = 0.05
+
+# Maximum number of tool-bound and structured-output runnables kept by the runnable registry
+runnable_registry_max_entries = 64
+
+# Researcher context compaction: default token budget of the message history sent to the research model
+# (overridable with the "researcher_context_token_budget" configurable), tools whose older outputs are
+# replaced by digests above the budget, and characters of each source summary kept in a digest
+researcher_context_token_budget = 30000
+compactable_tool_names = (
+    "tavily_search",
+    "think_tool",
+    "read_file",
+    "read_multiple_files",
+    "search_local_documents",
+    "semantic_search_local_documents",
+    "read_file_range",
+)
+compacted_summary_chars = 200
+
+# Default budget of a single researcher: tool-call iterations, research model tokens (prompt + completion)
+# and wall-clock seconds. Overridable per run with the configurable keys of the same name
+researcher_max_tool_call_iterations = 10
+researcher_max_tokens = 300000
+researcher_max_seconds = 300
@@ -0,0 +1,93 @@
+"""Token-Aware Compaction of the Researcher Message History.
+
+``researcher_messages`` keeps every tool output, and each ``llm_call`` resends the whole
+history, so the prompt grows with every research iteration. This module builds the view
+of the history sent to the research model: when the history exceeds a token budget, the
+oldest outputs of bulky tools are replaced by short digests (source titles, URLs and the
+start of each summary) until it fits.
+
+Compaction only applies to the prompt. The state keeps the full messages, so
+``compress_research`` still sees every tool output.
+"""
+
+import re
+from typing import List, Sequence
+
+from langchain_core.messages import AIMessage, BaseMessage, ToolMessage
+
+from deep_research import logger
+from deep_research.consts import compactable_tool_names, compacted_summary_chars
+from deep_research.tools.content_preprocessing import approximate_token_count
+
+_SEARCH_SOURCE_PATTERN = re.compile(r"--- SOURCE \d+: (.*?) ---\nURL: (\S+)\n\nSUMMARY:\n(.*?)\n\n-{80}", re.DOTALL)
+_SUMMARY_TAG_PATTERN = re.compile(r"</?(summary|key_excerpts)>")
+
+
+def message_token_count(message: BaseMessage) -> int:
+    """Approximate the number of tokens of a message, including the arguments of its tool calls."""
+    tokens = approximate_token_count(str(message.content))
+    for tool_call in getattr(message, "tool_calls", None) or []:
+        tokens += approximate_token_count(str(tool_call["args"]))
+    return tokens
+
+
+def _digest_search_output(content: str) -> str:
+    sources = _SEARCH_SOURCE_PATTERN.findall(content)
+    if not sources:
+        return _digest_text(content)
+    digest = "[Search output compacted, sources already reviewed]\n"
+    for i, (title, url, summary) in enumerate(sources, 1):
+        excerpt = " ".join(_SUMMARY_TAG_PATTERN.sub(" ", summary).split())[:compacted_summary_chars]
+        digest += f"{i}. {title} ({url}): {excerpt}...\n"
+    return digest
+
+
+def _digest_text(content: str) -> str:
+    return f"[Output compacted, already reviewed]\n{content[:compacted_summary_chars]}..."
+
+
+def digest_tool_message(message: ToolMessage) -> ToolMessage:
+    """Return a copy of a tool message whose content is replaced by a short digest."""
+    content = str(message.content)
+    if message.name == "tavily_search":
+        digest = _digest_search_output(content)
+    elif message.name == "think_tool":
+        # The reflection is already in the arguments of the tool call
+        digest = "Reflection recorded."
+    else:
+        digest = _digest_text(content)
+    return message.model_copy(update={"content": digest})
+
+
+def compact_messages(messages: Sequence[BaseMessage], token_budget: int) -> List[BaseMessage]:
+    """Replace the oldest bulky tool outputs by digests until the history fits ``token_budget``.
+
+    The tool outputs answering the last model turn are never compacted, since the model
+    has not read them yet.
+
+    Args:
+        messages: Researcher message history
+        token_budget: Approximate number of tokens the history should fit in
+
+    Returns:
+        Messages to send to the model, in the original order
+    """
+    total_tokens = sum(message_token_count(message) for message in messages)
+    if total_tokens <= token_budget:
+        return list(messages)
+
+    last_turn_index = max((i for i, message in enumerate(messages) if isinstance(message, AIMessage)), default=0)
+    compacted = list(messages)
+    compacted_count = 0
+    for i, message in enumerate(messages[:last_turn_index]):
+        if total_tokens <= token_budget:
+            break
+        if not isinstance(message, ToolMessage) or message.name not in compactable_tool_names:
+            continue
+        digest = digest_tool_message(message)
+        total_tokens -= message_token_count(message) - message_token_count(digest)
+        compacted[i] = digest
+        compacted_count += 1
+
+    logger.info(f"Compacted {compacted_count} tool outputs, researcher prompt history at ~{total_tokens} tokens")
+    return compacted
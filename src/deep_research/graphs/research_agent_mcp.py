@@ -11,6 +11,9 @@ Key features:
 - Secure directory access with permission checking
 - Research compression for efficient processing
 - Lazy MCP client initialization for LangGraph Platform compatibility
+- Warm pool of MCP sessions shared by concurrent researchers, with health checks and restarts
+- In-process BM25 index of local document passages, searched and read by line range without the MCP server
+- Local hashed-feature vector search over the same passages, from a memory-mapped NumPy matrix
 """
 
 from langgraph.graph import END, START, StateGraph
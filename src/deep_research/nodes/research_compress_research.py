@@ -1,36 +1,53 @@
-from langchain_core.messages import HumanMessage, SystemMessage, filter_messages
+from langchain_core.messages import AIMessage, HumanMessage, filter_messages
+from langchain_core.runnables import RunnableConfig
 
 from deep_research import logger
-from deep_research.chains import compress_model
+from deep_research.chains import COMPRESS_MODEL, compress_model
+from deep_research.prompt_caching import cached_system_message, record_cache_usage
 from deep_research.prompts import (
     compress_research_human_message,
     compress_research_system_prompt,
 )
+from deep_research.research_budget import ResearchBudget
 from deep_research.states.state_research import ResearcherState
 from deep_research.tools.search_tools import tavily_search
 from deep_research.tools.think_tools import think_tool
-from deep_research.utils import get_today_str
 
 tools = [tavily_search, think_tool]
 tools_by_name = {tool.name: tool for tool in tools}
 
 
-def compress_research(state: ResearcherState) -> dict:
+def compress_research(state: ResearcherState, config: RunnableConfig) -> dict:
     """Compress research findings into a concise summary.
 
     Takes all the research messages and tool outputs and creates
     a compressed summary suitable for the supervisor's decision-making.
+    Also reports the research budget caps and usage of the researcher.
     """
     logger.info("***[RESEARCH] NODE compress_research***")
-    system_message = compress_research_system_prompt.format(date=get_today_str())
+    system_message = cached_system_message(compress_research_system_prompt, COMPRESS_MODEL)
+    researcher_messages = list(state.get("researcher_messages", []))
+    if researcher_messages and getattr(researcher_messages[-1], "tool_calls", None):
+        # Stopped by the research budget, the last tool calls were never executed
+        last_message = researcher_messages.pop()
+        if last_message.content:
+            researcher_messages.append(AIMessage(content=last_message.content))
     messages = (
-        [SystemMessage(content=system_message)]
-        + state.get("researcher_messages", [])
+        [system_message]
+        + researcher_messages
         + [HumanMessage(content=compress_research_human_message)]
     )
     response = compress_model.invoke(messages)
+    record_cache_usage("compress_research", response)
 
     # Extract raw notes from tool and AI messages
     raw_notes = [str(m.content) for m in filter_messages(state["researcher_messages"], include_types=["tool", "ai"])]
 
-    return {"compressed_research": str(response.content), "raw_notes": ["\n".join(raw_notes)]}
+    research_budget = ResearchBudget.from_config(config).usage(state)
+    logger.info(f"Research budget used: {research_budget}")
+
+    return {
+        "compressed_research": str(response.content),
+        "raw_notes": ["\n".join(raw_notes)],
+        "research_budget": research_budget,
+    }
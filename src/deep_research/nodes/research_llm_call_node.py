@@ -1,39 +1,51 @@
-from langchain_core.messages import SystemMessage
+import time
+
+from langchain_core.runnables import RunnableConfig
 
 from deep_research import logger
-from deep_research.chains import research_model
+from deep_research.chains import RESEARCH_MODEL, research_model
+from deep_research.chains.runnable_registry import get_model_with_tools
+from deep_research.consts import researcher_context_token_budget
+from deep_research.context_compaction import compact_messages
+from deep_research.prompt_caching import cached_system_message, record_cache_usage
 from deep_research.prompts import research_agent_prompt, research_agent_prompt_with_mcp
+from deep_research.research_budget import budget_update
 from deep_research.states.state_research import ResearcherState
-from deep_research.tools import get_mcp_client
+from deep_research.tools import get_mcp_tools
+from deep_research.tools.local_search_tools import local_document_tools
 from deep_research.tools.search_tools import tavily_search
 from deep_research.tools.think_tools import think_tool
-from deep_research.utils import get_today_str
 
 tools = [tavily_search, think_tool]
 tools_by_name = {tool.name: tool for tool in tools}
 
 
-def llm_call(state: ResearcherState):
+def _prompt_messages(state: ResearcherState, config: RunnableConfig) -> list:
+    """Return the researcher history compacted to the token budget of the run."""
+    token_budget = config.get("configurable", {}).get("researcher_context_token_budget", researcher_context_token_budget)
+    return compact_messages(state["researcher_messages"], token_budget)
+
+
+def llm_call(state: ResearcherState, config: RunnableConfig):
     """Analyze current state and decide on next actions.
 
     The model analyzes the current conversation state and decides whether to:
     1. Call search tools to gather more information
     2. Provide a final answer based on gathered information
 
-    Returns updated state with the model's response.
+    Older search outputs are compacted to keep the prompt within the token budget.
+    Returns updated state with the model's response and the research budget consumed.
     """
     logger.info("***[RESEARCH] NODE llm_call***")
-    model_with_tools = research_model.bind_tools(tools)
-    return {
-        "researcher_messages": [
-            model_with_tools.invoke(
-                [SystemMessage(content=research_agent_prompt.format(date=get_today_str()))] + state["researcher_messages"]
-            )
-        ]
-    }
+    started_at = state.get("research_started_at") or time.time()
+    model_with_tools = get_model_with_tools(research_model, tools)
+    prompt = [cached_system_message(research_agent_prompt, RESEARCH_MODEL)] + _prompt_messages(state, config)
+    response = model_with_tools.invoke(prompt)
+    record_cache_usage("llm_call", response)
+    return {"researcher_messages": [response], **budget_update(state, prompt, response, started_at)}
 
 
-async def llm_call_mcp(state: ResearcherState):
+async def llm_call_mcp(state: ResearcherState, config: RunnableConfig):
     """Analyze current state and decide on tool usage with MCP integration.
 
     This node:
@@ -41,25 +53,24 @@ async def llm_call_mcp(state: ResearcherState):
     2. Binds tools to the language model
     3. Processes user input and decides on tool usage
 
-    Returns updated state with model response.
+    The tool list is cached by the MCP session pool and the bound model by the runnable registry.
+    Older file outputs are compacted to keep the prompt within the token budget.
+    Returns updated state with model response and the research budget consumed.
     """
     logger.info("***[RESEARCH] NODE llm_call_mcp***")
+    started_at = state.get("research_started_at") or time.time()
+
     # Get available tools from MCP server
-    client = get_mcp_client()
-    mcp_tools = await client.get_tools()
+    mcp_tools = await get_mcp_tools()
 
-    # Use MCP tools for local document access
-    all_tools = mcp_tools + [think_tool]
+    # Use MCP tools and the in-process document index for local document access
+    all_tools = mcp_tools + local_document_tools + [think_tool]
 
-    # Initialize model with tool binding
-    model_with_tools = research_model.bind_tools(all_tools)
+    # Reuse the model bound to the same tools, tools rediscovered after a server restart get a new binding
+    model_with_tools = get_model_with_tools(research_model, all_tools)
 
     # Process user input with system prompt
-    return {
-        "researcher_messages": [
-            model_with_tools.invoke(
-                [SystemMessage(content=research_agent_prompt_with_mcp.format(date=get_today_str()))]
-                + state["researcher_messages"]
-            )
-        ]
-    }
+    prompt = [cached_system_message(research_agent_prompt_with_mcp, RESEARCH_MODEL)] + _prompt_messages(state, config)
+    response = await model_with_tools.ainvoke(prompt)
+    record_cache_usage("llm_call_mcp", response)
+    return {"researcher_messages": [response], **budget_update(state, prompt, response, started_at)}
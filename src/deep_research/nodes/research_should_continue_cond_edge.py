@@ -1,13 +1,17 @@
+from langchain_core.runnables import RunnableConfig
 from typing_extensions import Literal
 
+from deep_research import logger
+from deep_research.research_budget import ResearchBudget
 from deep_research.states.state_research import ResearcherState
 
 
-def should_continue(state: ResearcherState) -> Literal["tool_node", "compress_research"]:
+def should_continue(state: ResearcherState, config: RunnableConfig) -> Literal["tool_node", "compress_research"]:
     """Determine whether to continue research or provide final answer.
 
     Determines whether the agent should continue the research loop or provide
-    a final answer based on whether the LLM made tool calls.
+    a final answer based on whether the LLM made tool calls, and whether the
+    researcher is still within its budget of iterations, tokens and time.
 
     Returns:
         "tool_node": Continue to tool execution
@@ -15,6 +19,11 @@ def should_continue(state: ResearcherState) -> Literal["tool_node", "compress_re
     """
     messages = state["researcher_messages"]
     last_message = messages[-1]
-    if last_message.tool_calls:
-        return "tool_node"
-    return "compress_research"
+    if not last_message.tool_calls:
+        return "compress_research"
+
+    stop_reason = ResearchBudget.from_config(config).exhausted(state)
+    if stop_reason:
+        logger.warning(f"Researcher budget reached ({stop_reason}), compressing research: {state.get('research_topic', '')}")
+        return "compress_research"
+    return "tool_node"
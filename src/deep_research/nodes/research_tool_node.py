@@ -1,8 +1,12 @@
+import asyncio
+
 from langchain_core.messages import ToolMessage
 
 from deep_research import logger
+from deep_research.consts import max_concurrent_mcp_tool_calls, max_concurrent_tool_calls
 from deep_research.states.state_research import ResearcherState
-from deep_research.tools import get_mcp_client
+from deep_research.tools import get_mcp_tools
+from deep_research.tools.local_search_tools import local_document_tools
 from deep_research.tools.search_tools import tavily_search
 from deep_research.tools.think_tools import think_tool
 
@@ -10,26 +14,54 @@ tools = [tavily_search, think_tool]
 tools_by_name = {tool.name: tool for tool in tools}
 
 
-def tool_node(state: ResearcherState):
+async def execute_tool_calls(
+    tool_calls: list[dict], available_tools: dict, max_concurrency: int = max_concurrent_tool_calls
+) -> list[ToolMessage]:
+    """Execute independent tool calls concurrently.
+
+    A failing tool call is returned as an error ToolMessage instead of failing the others.
+
+    Args:
+        tool_calls: Tool calls from the last AI message
+        available_tools: Available tools keyed by name
+        max_concurrency: Maximum number of tool calls running at the same time
+
+    Returns:
+        Tool messages in the same order as ``tool_calls``
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def execute(tool_call: dict) -> ToolMessage:
+        async with semaphore:
+            try:
+                if tool_call["name"] not in available_tools:
+                    raise ValueError(f"Unknown tool: {tool_call['name']}")
+                observation = await available_tools[tool_call["name"]].ainvoke(tool_call["args"])
+                return ToolMessage(content=observation, name=tool_call["name"], tool_call_id=tool_call["id"])
+            except Exception as e:
+                logger.warning(f"Tool call {tool_call['name']} failed: {str(e)}")
+                return ToolMessage(
+                    content=f"Error executing tool {tool_call['name']}: {str(e)}",
+                    name=tool_call["name"],
+                    tool_call_id=tool_call["id"],
+                    status="error",
+                )
+
+    return await asyncio.gather(*(execute(tool_call) for tool_call in tool_calls))
+
+
+async def tool_node(state: ResearcherState):
     """Execute all tool calls from the previous LLM response.
 
-    Executes all tool calls from the previous LLM responses.
+    Executes all tool calls from the previous LLM responses concurrently. Tools are awaited
+    so that searches run on the event loop and share the run's URL registry.
     Returns updated state with tool execution results.
     """
     logger.info("***[RESEARCH] NODE tool_node***")
     tool_calls = state["researcher_messages"][-1].tool_calls
 
-    # Execute all tool calls
-    observations = []
-    for tool_call in tool_calls:
-        tool = tools_by_name[tool_call["name"]]
-        observations.append(tool.invoke(tool_call["args"]))
-
-    # Create tool message outputs
-    tool_outputs = [
-        ToolMessage(content=observation, name=tool_call["name"], tool_call_id=tool_call["id"])
-        for observation, tool_call in zip(observations, tool_calls)
-    ]
+    # Execute all tool calls and create tool message outputs
+    tool_outputs = await execute_tool_calls(tool_calls, tools_by_name)
 
     return {"researcher_messages": tool_outputs}
 
@@ -39,8 +71,8 @@ async def tool_node_mcp(state: ResearcherState):
 
     This node:
     1. Retrieves current tool calls from the last message
-    2. Executes all tool calls using async operations (required for MCP)
-    3. Returns formatted tool results
+    2. Executes independent tool calls concurrently, up to max_concurrent_mcp_tool_calls
+    3. Returns formatted tool results, in the order of the tool calls
 
     Note: MCP requires async operations due to inter-process communication
     with the MCP server subprocess. This is unavoidable.
@@ -48,38 +80,10 @@ async def tool_node_mcp(state: ResearcherState):
     logger.info("***[RESEARCH] NODE tool_node_mcp***")
     tool_calls = state["researcher_messages"][-1].tool_calls
 
-    async def execute_tools():
-        """Execute all tool calls. MCP tools require async execution."""
-        # Get fresh tool references from MCP server
-        client = get_mcp_client()
-        mcp_tools = await client.get_tools()
-        all_tools = mcp_tools + [think_tool]
-        all_tools_by_name = {tool.name: tool for tool in all_tools}
-
-        # Execute tool calls (sequentially for reliability)
-        observations = []
-        for tool_call in tool_calls:
-            tool = all_tools_by_name[tool_call["name"]]
-            if tool_call["name"] == "think_tool":
-                # think_tool is sync, use regular invoke
-                observation = tool.invoke(tool_call["args"])
-            else:
-                # MCP tools are async, use ainvoke
-                observation = await tool.ainvoke(tool_call["args"])
-            observations.append(observation)
-
-        # Format results as tool messages
-        tool_outputs = [
-            ToolMessage(
-                content=observation,
-                name=tool_call["name"],
-                tool_call_id=tool_call["id"],
-            )
-            for observation, tool_call in zip(observations, tool_calls)
-        ]
-
-        return tool_outputs
-
-    messages = await execute_tools()
+    # Get cached tool references from MCP server
+    mcp_tools = await get_mcp_tools()
+    all_tools_by_name = {tool.name: tool for tool in mcp_tools + local_document_tools + [think_tool]}
+
+    messages = await execute_tool_calls(tool_calls, all_tools_by_name, max_concurrency=max_concurrent_mcp_tool_calls)
 
     return {"researcher_messages": messages}
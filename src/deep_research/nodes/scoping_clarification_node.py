@@ -5,6 +5,7 @@ from typing_extensions import Literal
 
 from deep_research import logger
 from deep_research.chains import scoping_model
+from deep_research.chains.runnable_registry import get_structured_model
 from deep_research.prompts import clarify_with_user_instructions
 from deep_research.states.state_scope import AgentState, ClarifyWithUser
 from deep_research.utils import get_today_str
@@ -19,7 +20,7 @@ def clarify_with_user(state: AgentState) -> Command[Literal["write_research_brie
     """
     # Set up structured output model
     logger.info("***[SCOPING] NODE clarify_with_user***")
-    structured_output_model = scoping_model.with_structured_output(ClarifyWithUser)
+    structured_output_model = get_structured_model(scoping_model, ClarifyWithUser)
 
     # Invoke the model with clarification instructions
     response = structured_output_model.invoke(
@@ -2,6 +2,7 @@ from langchain_core.messages import HumanMessage, get_buffer_string
 
 from deep_research import logger
 from deep_research.chains import scoping_model
+from deep_research.chains.runnable_registry import get_structured_model
 from deep_research.prompts import transform_messages_into_research_topic_prompt
 from deep_research.states.state_scope import AgentState, ResearchQuestion
 from deep_research.utils import get_today_str
@@ -16,7 +17,7 @@ def write_research_brief(state: AgentState):
     """
     logger.info("***[SCOPING] NODE write_research_brief***")
     # Set up structured output model
-    structured_output_model = scoping_model.with_structured_output(ResearchQuestion)
+    structured_output_model = get_structured_model(scoping_model, ResearchQuestion)
 
     # Generate research brief from conversation history
     response = structured_output_model.invoke(
@@ -1,20 +1,28 @@
-import asyncio
+import json
+from contextlib import aclosing
+from functools import partial
 
 from langchain_core.messages import (
     BaseMessage,
-    HumanMessage,
     ToolMessage,
     filter_messages,
 )
+from langchain_core.runnables import RunnableConfig
+from langgraph.config import get_stream_writer
 from langgraph.graph import END
 from langgraph.types import Command
 from typing_extensions import Literal
 
 from deep_research import logger
 from deep_research.consts import max_researcher_iterations
-from deep_research.graphs.research_agent import researcher_agent
+from deep_research.research_budget import ResearchBudget
+from deep_research.researcher_backends import ResearcherJob, get_researcher_backend, researcher_configurable
+from deep_research.researcher_jobs import researcher_deadline, researcher_retry_policy
+from deep_research.researcher_scheduler import ResearcherScheduler, researcher_concurrency_limit
 from deep_research.states.state_multi_agent_supervisor import SupervisorState
+from deep_research.topic_dedup import finished_research, match_finished_research, reuse_threshold, reused_findings
 from deep_research.tools.think_tools import think_tool
+from deep_research.tools.url_registry import close_run_url_registry, open_run_url_registry, url_registry_scope
 
 
 def get_notes_from_tool_calls(messages: list[BaseMessage]) -> list[str]:
@@ -25,6 +33,8 @@ def get_notes_from_tool_calls(messages: list[BaseMessage]) -> list[str]:
     sub-agents via ConductResearch tool calls, each sub-agent returns its
     compressed findings as the content of a ToolMessage. This function
     extracts all such ToolMessage content to compile the final research notes.
+    Error messages of researchers that kept failing carry no findings and are skipped, as are
+    reused findings, which are already in the notes once.
 
     Args:
         messages: List of messages from supervisor's conversation history
@@ -32,20 +42,30 @@ def get_notes_from_tool_calls(messages: list[BaseMessage]) -> list[str]:
     Returns:
         List of research note strings extracted from ToolMessage objects
     """
-    return [tool_msg.content for tool_msg in filter_messages(messages, include_types="tool")]
+    return [
+        tool_msg.content
+        for tool_msg in filter_messages(messages, include_types="tool")
+        if tool_msg.status != "error" and not (isinstance(tool_msg.artifact, dict) and "reused_from" in tool_msg.artifact)
+    ]
 
 
-async def supervisor_tools(state: SupervisorState) -> Command[Literal["supervisor", "__end__"]]:
+async def supervisor_tools(state: SupervisorState, config: RunnableConfig) -> Command[Literal["supervisor", "__end__"]]:
     """Execute supervisor decisions - either conduct research or end the process.
 
     Handles:
     - Executing think_tool calls for strategic reflection
-    - Launching parallel research agents for different topics
+    - Launching parallel research agents for different topics, each under a deadline
+    - Reusing the findings of topics already researched in the run instead of launching
+      a research agent for an overlapping topic
+    - Retrying a failed research agent on its own, and reporting it as an error tool message
+      once its attempts are exhausted
+    - Streaming a progress event as each research agent finishes
     - Aggregating research results
     - Determining when research is complete
 
     Args:
         state: Current supervisor state with messages and iteration count
+        config: Run config, holding the researcher budget caps
 
     Returns:
         Command to continue supervision, end process, or handle errors
@@ -58,6 +78,8 @@ async def supervisor_tools(state: SupervisorState) -> Command[Literal["superviso
     # Initialize variables for single return pattern
     tool_messages = []
     all_raw_notes = []
+    researchers_avoided = 0
+    url_registry_id = state.get("url_registry_id")
     next_step = "supervisor"  # Default next step
     should_end = False
 
@@ -87,37 +109,106 @@ async def supervisor_tools(state: SupervisorState) -> Command[Literal["superviso
 
             # Handle ConductResearch calls (asynchronous)
             if conduct_research_calls:
-                # Launch parallel research agents
-                coros = [
-                    researcher_agent.ainvoke(
-                        {
-                            "researcher_messages": [HumanMessage(content=tool_call["args"]["research_topic"])],
-                            "research_topic": tool_call["args"]["research_topic"],
-                        }
+                # Reuse the findings of topics already researched in this run instead of researching them again
+                finished = finished_research(supervisor_messages)
+                threshold = reuse_threshold(config)
+                reused_matches = {}
+                launched_calls = []
+                for tool_call in conduct_research_calls:
+                    match = match_finished_research(tool_call["args"]["research_topic"], finished, threshold)
+                    if match:
+                        reused_matches[tool_call["id"]] = match
+                    else:
+                        launched_calls.append(tool_call)
+                if reused_matches:
+                    researchers_avoided = len(reused_matches)
+                    logger.info(f"Reused earlier findings for {researchers_avoided} overlapping research topics")
+
+                # Launch parallel research agents on the researcher backend, recording their budget caps in the run metadata
+                researcher_metadata = ResearchBudget.from_config(config).as_metadata()
+                configurable = researcher_configurable(config)
+                deadline_seconds, partial_findings = researcher_deadline(config)
+                max_attempts, base_delay = researcher_retry_policy(config)
+                researcher_backend = get_researcher_backend()
+                jobs = [
+                    partial(
+                        researcher_backend.run,
+                        ResearcherJob(
+                            tool_call["args"]["research_topic"],
+                            researcher_metadata,
+                            configurable,
+                            deadline_seconds,
+                            partial_findings,
+                            max_attempts,
+                            base_delay,
+                        ),
                     )
-                    for tool_call in conduct_research_calls
+                    for tool_call in launched_calls
                 ]
 
-                # Wait for all research to complete
-                tool_results = await asyncio.gather(*coros)
+                # Collect research as each researcher finishes, at most max_concurrent_researchers at a time,
+                # sharing page summaries between the researchers of the whole run and streaming a progress event per researcher
+                scheduler = ResearcherScheduler(researcher_concurrency_limit(config))
+                stream_writer = get_stream_writer()
+                tool_results = {}
+                url_registry_id, url_registry = open_run_url_registry(url_registry_id)
+                with url_registry_scope(url_registry):
+                    async with aclosing(scheduler.as_completed(jobs)) as completed:
+                        async for index, result in completed:
+                            tool_results[launched_calls[index]["id"]] = result
+                            progress = {
+                                "research_topic": launched_calls[index]["args"]["research_topic"],
+                                "timed_out": result["timed_out"],
+                                "failed": "error" in result,
+                                "attempts": result["attempts"],
+                                "seconds": round(result["seconds"], 1),
+                                "completed": len(tool_results),
+                                "total": len(jobs),
+                            }
+                            logger.info(f"Researcher {progress['completed']}/{progress['total']} finished: {progress}")
+                            stream_writer({"researcher_finished": progress})
 
                 # Format research results as tool messages
                 # Each sub-agent returns compressed research findings in result["compressed_research"]
                 # We write this compressed research as the content of a ToolMessage, which allows
-                # the supervisor to later retrieve these findings via get_notes_from_tool_calls()
-                research_tool_messages = [
-                    ToolMessage(
-                        content=result.get("compressed_research", "Error synthesizing research report"),
-                        name=tool_call["name"],
-                        tool_call_id=tool_call["id"],
-                    )
-                    for result, tool_call in zip(tool_results, conduct_research_calls)
-                ]
-
-                tool_messages.extend(research_tool_messages)
+                # the supervisor to later retrieve these findings via get_notes_from_tool_calls().
+                # A researcher that kept failing is reported as an error, so the supervisor can re-delegate its topic
+                for tool_call in conduct_research_calls:
+                    if tool_call["id"] in reused_matches:
+                        match = reused_matches[tool_call["id"]]
+                        tool_messages.append(
+                            ToolMessage(
+                                content=reused_findings(match),
+                                name=tool_call["name"],
+                                tool_call_id=tool_call["id"],
+                                artifact={"reused_from": match.research.research_topic, "score": match.score},
+                            )
+                        )
+                        continue
+                    result = tool_results[tool_call["id"]]
+                    if "error" in result:
+                        tool_messages.append(
+                            ToolMessage(
+                                content=json.dumps({"error": result["error"]}),
+                                name=tool_call["name"],
+                                tool_call_id=tool_call["id"],
+                                status="error",
+                                artifact=result["error"],
+                            )
+                        )
+                    else:
+                        # Findings of a researcher stopped at its deadline are marked, so they are never reused
+                        tool_messages.append(
+                            ToolMessage(
+                                content=result.get("compressed_research", "Error synthesizing research report"),
+                                name=tool_call["name"],
+                                tool_call_id=tool_call["id"],
+                                artifact={"timed_out": True} if result.get("timed_out") else None,
+                            )
+                        )
 
                 # Aggregate raw notes from all research
-                all_raw_notes = ["\n".join(result.get("raw_notes", [])) for result in tool_results]
+                all_raw_notes = ["\n".join(result.get("raw_notes", [])) for result in tool_results.values()]
 
         except Exception as e:
             print(f"Error in supervisor tools: {e}")
@@ -126,9 +217,18 @@ async def supervisor_tools(state: SupervisorState) -> Command[Literal["superviso
 
     # Single return point with appropriate state updates
     if should_end:
+        close_run_url_registry(url_registry_id)
         return Command(
             goto=next_step,
             update={"notes": get_notes_from_tool_calls(supervisor_messages), "research_brief": state.get("research_brief", "")},
         )
     else:
-        return Command(goto=next_step, update={"supervisor_messages": tool_messages, "raw_notes": all_raw_notes})
+        return Command(
+            goto=next_step,
+            update={
+                "supervisor_messages": tool_messages,
+                "raw_notes": all_raw_notes,
+                "researchers_avoided": researchers_avoided,
+                **({"url_registry_id": url_registry_id} if url_registry_id else {}),
+            },
+        )
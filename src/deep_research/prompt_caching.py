@@ -0,0 +1,73 @@
+"""Provider Prompt Caching of the Static System Prompts.
+
+The research, supervisor and compression system prompts are long static prefixes, with
+only ``{date}`` changing once a day, and are resent on every model call. This module:
+- renders each system prompt once per day and memoizes the resulting message
+- marks the system prompt of Anthropic models with a cache-control breakpoint, so the
+  tools and system prompt are read from the provider cache on later calls
+- keeps the system prompt as the first, byte-identical message for other providers, so
+  OpenAI's automatic prefix caching applies
+- records input, cache-read and cache-write token counts per node
+"""
+
+import threading
+from collections import defaultdict
+from functools import lru_cache
+
+from langchain_core.messages import AIMessage, SystemMessage
+
+from deep_research import logger
+from deep_research.utils import get_today_str
+
+
+@lru_cache(maxsize=64)
+def _render_system_message(template: str, model_name: str, date: str, format_kwargs: tuple) -> SystemMessage:
+    content = template.format(date=date, **dict(format_kwargs))
+    if model_name.startswith("anthropic:"):
+        return SystemMessage(content=[{"type": "text", "text": content, "cache_control": {"type": "ephemeral"}}])
+    return SystemMessage(content=content)
+
+
+def cached_system_message(template: str, model_name: str, **format_kwargs) -> SystemMessage:
+    """Return the system message rendered from ``template`` for today, memoized per day.
+
+    Args:
+        template: System prompt template with a ``{date}`` placeholder
+        model_name: Provider-prefixed name of the model receiving the prompt, e.g. "anthropic:claude-sonnet-4"
+        **format_kwargs: Other placeholders of the template
+
+    Returns:
+        System message, with a cache-control breakpoint for Anthropic models
+    """
+    return _render_system_message(template, model_name, get_today_str(), tuple(sorted(format_kwargs.items())))
+
+
+# node name -> token counters
+_cache_usage: dict[str, dict[str, int]] = defaultdict(
+    lambda: {"calls": 0, "input_tokens": 0, "cache_read": 0, "cache_creation": 0}
+)
+_cache_usage_lock = threading.Lock()
+
+
+def record_cache_usage(node_name: str, response: AIMessage) -> None:
+    """Add the input and cached token counts of ``response`` to the counters of ``node_name``."""
+    usage_metadata = getattr(response, "usage_metadata", None)
+    if not usage_metadata:
+        return
+    input_token_details = usage_metadata.get("input_token_details", {})
+    with _cache_usage_lock:
+        usage = _cache_usage[node_name]
+        usage["calls"] += 1
+        usage["input_tokens"] += usage_metadata.get("input_tokens", 0)
+        usage["cache_read"] += input_token_details.get("cache_read", 0) or 0
+        usage["cache_creation"] += input_token_details.get("cache_creation", 0) or 0
+    logger.debug(f"{node_name}: {input_token_details.get('cache_read', 0)} cached input tokens")
+
+
+def prompt_cache_stats() -> dict:
+    """Return the input and cached token counts per node, with the share of input tokens read from cache."""
+    with _cache_usage_lock:
+        return {
+            node_name: {**usage, "cache_hit_rate": usage["cache_read"] / usage["input_tokens"] if usage["input_tokens"] else 0.0}
+            for node_name, usage in _cache_usage.items()
+        }
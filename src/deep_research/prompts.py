@@ -202,7 +202,10 @@ You can use any of the tools provided to you to find and read files that help an
 </Task>
 
 <Available Tools>
-You have access to file system tools and thinking tools:
+You have access to local search tools, file system tools and thinking tools:
+- **search_local_documents**: Search all local files at once and get the most relevant passages with their file and line range
+- **semantic_search_local_documents**: Find passages using variants of your query words when exact keywords find nothing
+- **read_file_range**: Read a range of lines of a file, e.g. the context around a passage
 - **list_allowed_directories**: See what directories you can access
 - **list_directory**: List files in directories
 - **read_file**: Read individual files
@@ -217,9 +220,9 @@ You have access to file system tools and thinking tools:
 Think like a human researcher with access to a document library. Follow these steps:
 
 1. **Read the question carefully** - What specific information does the user need?
-2. **Explore available files** - Use list_allowed_directories and list_directory to understand what's available
-3. **Identify relevant files** - Use search_files if needed to find documents matching the topic
-4. **Read strategically** - Start with most relevant files, use read_multiple_files for efficiency
+2. **Search before reading** - Use search_local_documents to find the passages relevant to the topic
+3. **Read around relevant passages** - Use read_file_range to read more context instead of whole files
+4. **Read whole files only when needed** - Use list_directory and read_file when passages are not enough
 5. **After reading, pause and assess** - Do I have enough to answer? What's still missing?
 6. **Stop when you can answer confidently** - Don't keep reading for perfection
 </Instructions>
@@ -0,0 +1,103 @@
+"""Budget Governor of the Researcher Loop.
+
+A researcher keeps looping as long as its model emits tool calls. This module caps each
+researcher on three budgets:
+- tool-call iterations: model turns requesting tools
+- tokens: prompt and completion tokens of the research model
+- wall-clock seconds since the researcher started
+
+The caps are read from the ``configurable`` section of the run config, falling back to
+the defaults in ``consts.py``, so a run can tighten or relax them without code changes.
+Once a cap is hit the researcher stops calling tools and compresses what it found.
+"""
+
+import time
+from typing import NamedTuple, Optional
+
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.runnables import RunnableConfig
+
+from deep_research.consts import (
+    researcher_max_seconds,
+    researcher_max_tokens,
+    researcher_max_tool_call_iterations,
+)
+from deep_research.context_compaction import message_token_count
+
+
+class ResearchBudget(NamedTuple):
+    """Caps of a single researcher."""
+
+    max_tool_call_iterations: int = researcher_max_tool_call_iterations
+    max_tokens: int = researcher_max_tokens
+    max_seconds: float = researcher_max_seconds
+
+    @classmethod
+    def from_config(cls, config: Optional[RunnableConfig]) -> "ResearchBudget":
+        """Read the caps from the ``researcher_max_*`` configurable keys of the run config."""
+        configurable = (config or {}).get("configurable", {})
+        return cls(
+            max_tool_call_iterations=configurable.get("researcher_max_tool_call_iterations", researcher_max_tool_call_iterations),
+            max_tokens=configurable.get("researcher_max_tokens", researcher_max_tokens),
+            max_seconds=configurable.get("researcher_max_seconds", researcher_max_seconds),
+        )
+
+    def as_metadata(self) -> dict:
+        """Return the caps as run metadata."""
+        return {f"researcher_{name}": value for name, value in self._asdict().items()}
+
+    def exhausted(self, state: dict) -> Optional[str]:
+        """Return which cap the researcher state has reached, or None while within budget."""
+        # The iteration count includes the model turn being checked, whose tool calls have not run yet
+        if state.get("tool_call_iterations", 0) > self.max_tool_call_iterations:
+            return "max_tool_call_iterations"
+        if state.get("tokens_used", 0) >= self.max_tokens:
+            return "max_tokens"
+        started_at = state.get("research_started_at")
+        if started_at is not None and time.time() - started_at >= self.max_seconds:
+            return "max_seconds"
+        return None
+
+    def usage(self, state: dict) -> dict:
+        """Return the caps, the budget consumed by the researcher state and the cap that stopped it, if any.
+
+        Tool-call iterations count the tool rounds that ran, not the last turn stopped by the budget.
+        """
+        started_at = state.get("research_started_at")
+        messages = state.get("researcher_messages", [])
+        # A researcher stopped by its budget ends on tool calls that were never executed
+        stopped_by_budget = bool(messages) and bool(getattr(messages[-1], "tool_calls", None))
+        return {
+            **self._asdict(),
+            "tool_call_iterations": state.get("tool_call_iterations", 0) - (1 if stopped_by_budget else 0),
+            "tokens_used": state.get("tokens_used", 0),
+            "seconds": time.time() - started_at if started_at is not None else 0.0,
+            "stop_reason": self.exhausted(state) if stopped_by_budget else None,
+        }
+
+
+def _response_tokens(prompt: list[BaseMessage], response: AIMessage) -> int:
+    usage_metadata = getattr(response, "usage_metadata", None)
+    if usage_metadata:
+        return usage_metadata["total_tokens"]
+    # Providers not reporting usage are counted approximately
+    return sum(message_token_count(message) for message in prompt) + message_token_count(response)
+
+
+def budget_update(state: dict, prompt: list[BaseMessage], response: AIMessage, started_at: float) -> dict:
+    """Return the state updates accounting for one research model call.
+
+    Args:
+        state: Researcher state before the call
+        prompt: Messages sent to the model
+        response: Model response
+        started_at: Time the researcher started, i.e. before its first model call
+
+    Returns:
+        Updated tool-call iteration count, token count and start time of the researcher
+    """
+    return {
+        "tool_call_iterations": state.get("tool_call_iterations", 0) + (1 if response.tool_calls else 0),
+        "tokens_used": state.get("tokens_used", 0) + _response_tokens(prompt, response),
+        "research_started_at": started_at,
+    }
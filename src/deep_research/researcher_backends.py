@@ -0,0 +1,401 @@
+"""Pluggable Execution Backends for the Researchers Launched by the Supervisor.
+
+By default every researcher runs in the supervisor's process and event loop, where the
+CPU-bound parts of research (parsing large search responses, page preprocessing, message
+serialization) compete for one GIL. The supervisor instead hands each researcher job to a
+``ResearcherBackend``:
+- ``InProcessResearcherBackend``: runs the job on the current event loop (the default)
+- ``ProcessPoolResearcherBackend``: runs the job in a local pool of worker processes
+- ``QueueResearcherBackend``: puts the job on a ``JobQueue`` served by worker processes,
+  possibly on other nodes. ``LocalJobQueue`` is a local stand-in for a shared broker
+
+A job carries everything a worker needs, including its deadline, retry policy and the
+per-run overrides read by the researcher nodes, since a worker process has no access to
+the run config of the supervisor. Jobs and results cross process boundaries as
+zlib-compressed compact JSON, and only the result fields read by the supervisor are sent
+back. A backend failure (e.g. a crashed worker process) is returned as an error result
+like a failed researcher, and remote waits are bounded by the longest time the job could
+take. Each worker process runs its jobs on one long-lived event loop, the one its async
+clients are bound to. Page summaries are shared between researchers of the same process
+only; other processes share them through the persistent summary cache.
+
+The backend is selected with ``RESEARCHER_BACKEND`` in the app config, or the environment
+variable of the same name.
+"""
+
+import asyncio
+import json
+import os
+import queue
+import threading
+import uuid
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import NamedTuple, Optional, Protocol
+
+from langchain_core.runnables import RunnableConfig
+
+from deep_research import config, logger
+from deep_research.consts import (
+    researcher_backend_timeout_margin,
+    researcher_backend_workers,
+    researcher_deadline_seconds,
+    researcher_max_attempts,
+    researcher_partial_compression_seconds,
+    researcher_partial_findings,
+    researcher_retry_base_delay,
+    researcher_retry_max_delay,
+)
+from deep_research.researcher_jobs import run_researcher_with_retry
+from deep_research.utils import worker_process_context
+
+# Fields of the researcher output read by the supervisor, the only ones sent back by workers
+RESULT_KEYS = ("compressed_research", "raw_notes", "research_budget", "timed_out", "seconds", "attempts", "error")
+
+# Modules imported once by the fork server of the researcher workers
+WORKER_PRELOAD = ("deep_research.researcher_backends",)
+
+# Configurable keys of the run config read by the researcher nodes, sent along with each job
+RESEARCHER_CONFIGURABLE_KEYS = (
+    "researcher_max_tool_call_iterations",
+    "researcher_max_tokens",
+    "researcher_max_seconds",
+    "researcher_context_token_budget",
+)
+
+
+def researcher_configurable(config: Optional[RunnableConfig]) -> dict:
+    """Return the configurable keys of the run config read by the researcher nodes."""
+    configurable = (config or {}).get("configurable", {})
+    return {key: configurable[key] for key in RESEARCHER_CONFIGURABLE_KEYS if key in configurable}
+
+
+class ResearcherJob(NamedTuple):
+    """Everything needed to run one researcher, in any process."""
+
+    research_topic: str
+    metadata: dict = {}
+    configurable: dict = {}
+    deadline_seconds: float = researcher_deadline_seconds
+    partial_findings: bool = researcher_partial_findings
+    max_attempts: int = researcher_max_attempts
+    base_delay: float = researcher_retry_base_delay
+
+    def to_bytes(self) -> bytes:
+        """Serialize the job as compressed compact JSON."""
+        return _encode(self._asdict())
+
+    def max_seconds(self) -> float:
+        """Return the longest time the job can take, every attempt hitting its deadline, plus a margin."""
+        attempt_seconds = self.deadline_seconds + (researcher_partial_compression_seconds if self.partial_findings else 0)
+        backoff_seconds = (self.max_attempts - 1) * researcher_retry_max_delay
+        return self.max_attempts * attempt_seconds + backoff_seconds + researcher_backend_timeout_margin
+
+    @classmethod
+    def from_bytes(cls, payload: bytes) -> "ResearcherJob":
+        """Deserialize a job serialized with ``to_bytes``."""
+        return cls(**_decode(payload))
+
+
+def _encode(value: dict) -> bytes:
+    return zlib.compress(json.dumps(value, separators=(",", ":"), default=str).encode("utf-8"))
+
+
+def _decode(payload: bytes) -> dict:
+    return json.loads(zlib.decompress(payload))
+
+
+def _error_result(error: BaseException) -> dict:
+    return {
+        "compressed_research": "",
+        "raw_notes": [],
+        "error": {"type": type(error).__name__, "message": str(error), "attempts": 1},
+        "attempts": 1,
+        "timed_out": False,
+        "seconds": 0.0,
+    }
+
+
+async def execute_job(job: ResearcherJob, config: Optional[RunnableConfig] = None) -> dict:
+    """Run the researcher of ``job`` and return the result fields read by the supervisor.
+
+    Args:
+        job: Researcher job
+        config: Config of the researcher run, by default built from the configurable keys and
+            metadata of the job
+
+    Returns:
+        Researcher result, restricted to ``RESULT_KEYS``
+    """
+    if config is None:
+        config = {"configurable": job.configurable, "metadata": job.metadata}
+    result = await run_researcher_with_retry(
+        job.research_topic,
+        config,
+        job.deadline_seconds,
+        job.partial_findings,
+        job.max_attempts,
+        job.base_delay,
+    )
+    return {key: result[key] for key in RESULT_KEYS if key in result}
+
+
+# Event loop running the jobs of a worker process - will be initialized lazily
+_worker_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_worker_loop() -> asyncio.AbstractEventLoop:
+    """Get or create the event loop running every job of this worker process.
+
+    Long-lived async clients (e.g. the HTTP clients of the search backend and of the model
+    providers) stay bound to the loop of their first job, so jobs share one loop instead
+    of each running on a new loop closed when the job ends.
+    """
+    global _worker_loop
+    if _worker_loop is None:
+        _worker_loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(_worker_loop)
+    return _worker_loop
+
+
+def execute_job_payload(payload: bytes) -> bytes:
+    """Run a serialized job on the event loop of the worker process and return its serialized result.
+
+    Failures outside the researcher retries (e.g. a job that cannot be deserialized) are
+    returned as an error result, so a bad job never takes a worker down.
+    """
+    try:
+        result = get_worker_loop().run_until_complete(execute_job(ResearcherJob.from_bytes(payload)))
+    except Exception as e:
+        logger.error(f"Researcher job failed in worker {os.getpid()}: {e!r}")
+        result = _error_result(e)
+    return _encode(result)
+
+
+class ResearcherBackend(Protocol):
+    """Interface of the backends running researcher jobs."""
+
+    async def run(self, job: ResearcherJob) -> dict:
+        """Run the researcher of ``job`` and return its result."""
+        ...
+
+
+class InProcessResearcherBackend:
+    """Backend running researchers on the event loop of the supervisor."""
+
+    async def run(self, job: ResearcherJob) -> dict:
+        """Run the researcher of ``job`` as a coroutine of the current event loop."""
+        # The researcher inherits the run config of the supervisor, configurable keys included
+        return await execute_job(job, {"metadata": job.metadata})
+
+
+class ProcessPoolResearcherBackend:
+    """Backend running each researcher in a pool of local worker processes."""
+
+    def __init__(self, max_workers: int = researcher_backend_workers):
+        self.max_workers = max_workers
+        self.pool = ProcessPoolExecutor(max_workers=max_workers, mp_context=worker_process_context(WORKER_PRELOAD))
+
+    def _replace_broken_pool(self, broken_pool: ProcessPoolExecutor) -> None:
+        # Several jobs fail at once when a worker dies, the pool is only replaced once
+        if self.pool is broken_pool:
+            logger.warning("Researcher process pool broken, starting a new one")
+            broken_pool.shutdown(wait=False, cancel_futures=True)
+            self.pool = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=worker_process_context(WORKER_PRELOAD))
+
+    async def run(self, job: ResearcherJob) -> dict:
+        """Run the researcher of ``job`` in a worker process, returning an error result if the worker fails."""
+        pool = self.pool
+        loop = asyncio.get_running_loop()
+        try:
+            async with asyncio.timeout(job.max_seconds()):
+                return _decode(await loop.run_in_executor(pool, execute_job_payload, job.to_bytes()))
+        except BrokenProcessPool as e:
+            self._replace_broken_pool(pool)
+            logger.error(f"Researcher worker process died: {job.research_topic[:80]}")
+            return _error_result(e)
+        except Exception as e:
+            logger.error(f"Researcher job failed in the process pool: {job.research_topic[:80]}: {e!r}")
+            return _error_result(e)
+
+
+class JobQueue(Protocol):
+    """Interface of the queues feeding researcher jobs to workers, e.g. backed by a message broker.
+
+    Calls are blocking, and ``get_*`` return None when nothing arrives within ``timeout`` seconds.
+    """
+
+    def put_job(self, job_id: str, payload: bytes) -> None:
+        """Enqueue a serialized job."""
+        ...
+
+    def get_job(self, timeout: float) -> Optional[tuple[str, bytes]]:
+        """Dequeue the next serialized job."""
+        ...
+
+    def put_result(self, job_id: str, payload: bytes) -> None:
+        """Enqueue the serialized result of a job."""
+        ...
+
+    def get_result(self, timeout: float) -> Optional[tuple[str, bytes]]:
+        """Dequeue the next serialized result."""
+        ...
+
+
+class LocalJobQueue:
+    """Job queue shared by the processes of one machine, standing in for a shared broker."""
+
+    def __init__(self):
+        context = worker_process_context(WORKER_PRELOAD)
+        self.jobs = context.Queue()
+        self.results = context.Queue()
+
+    def put_job(self, job_id: str, payload: bytes) -> None:
+        """Enqueue a serialized job."""
+        self.jobs.put((job_id, payload))
+
+    def get_job(self, timeout: float) -> Optional[tuple[str, bytes]]:
+        """Dequeue the next serialized job."""
+        try:
+            return self.jobs.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def put_result(self, job_id: str, payload: bytes) -> None:
+        """Enqueue the serialized result of a job."""
+        self.results.put((job_id, payload))
+
+    def get_result(self, timeout: float) -> Optional[tuple[str, bytes]]:
+        """Dequeue the next serialized result."""
+        try:
+            return self.results.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+
+def serve_researcher_jobs(job_queue: JobQueue, poll_timeout: float = 1.0) -> None:
+    """Run researcher jobs from ``job_queue`` one after the other, until a None job id is received.
+
+    This is the entry point of a worker, started by ``QueueResearcherBackend`` for local
+    workers, or on other nodes against a queue backed by a shared broker.
+
+    Args:
+        job_queue: Queue to read jobs from and write results to
+        poll_timeout: Seconds to wait for a job before polling again
+    """
+    logger.info(f"Researcher worker {os.getpid()} started")
+    while True:
+        job = job_queue.get_job(poll_timeout)
+        if job is None:
+            continue
+        job_id, payload = job
+        if job_id is None:
+            break
+        job_queue.put_result(job_id, execute_job_payload(payload))
+
+
+class QueueResearcherBackend:
+    """Backend putting researcher jobs on a ``JobQueue`` and waiting for their results.
+
+    A dispatcher thread reads results from the queue and resolves the waiting job of the
+    same id, whatever event loop it runs on.
+    """
+
+    def __init__(self, job_queue: JobQueue, local_workers: int = 0):
+        """Create the backend, with ``local_workers`` worker processes serving ``job_queue`` on this machine."""
+        self.job_queue = job_queue
+        self.workers = [
+            worker_process_context(WORKER_PRELOAD).Process(target=serve_researcher_jobs, args=(job_queue,), daemon=True)
+            for _ in range(local_workers)
+        ]
+        for worker in self.workers:
+            worker.start()
+        self._waiting: dict[str, asyncio.Future] = {}
+        self._waiting_lock = threading.Lock()
+        self._dispatcher = threading.Thread(target=self._dispatch_results, name="researcher-results", daemon=True)
+        self._dispatcher.start()
+
+    def _dispatch_results(self) -> None:
+        while True:
+            result = self.job_queue.get_result(timeout=1.0)
+            if result is None:
+                continue
+            job_id, payload = result
+            with self._waiting_lock:
+                future = self._waiting.pop(job_id, None)
+            if future is None:
+                logger.warning(f"Dropped the result of researcher job {job_id}, nobody is waiting for it")
+                continue
+            future.get_loop().call_soon_threadsafe(_set_result, future, payload)
+
+    def _restart_dead_workers(self) -> None:
+        for i, worker in enumerate(self.workers):
+            if not worker.is_alive():
+                logger.warning(f"Researcher worker {worker.pid} died, starting a new one")
+                self.workers[i] = worker_process_context(WORKER_PRELOAD).Process(
+                    target=serve_researcher_jobs, args=(self.job_queue,), daemon=True
+                )
+                self.workers[i].start()
+
+    async def run(self, job: ResearcherJob) -> dict:
+        """Enqueue ``job`` and wait for its result, returning an error result if none arrives in time."""
+        self._restart_dead_workers()
+        job_id = uuid.uuid4().hex
+        future = asyncio.get_running_loop().create_future()
+        with self._waiting_lock:
+            self._waiting[job_id] = future
+        try:
+            async with asyncio.timeout(job.max_seconds()):
+                await asyncio.to_thread(self.job_queue.put_job, job_id, job.to_bytes())
+                return _decode(await future)
+        except TimeoutError:
+            logger.error(f"No result for researcher job {job_id} within {job.max_seconds():.0f}s: {job.research_topic[:80]}")
+            return _error_result(TimeoutError(f"No result from the researcher worker within {job.max_seconds():.0f}s"))
+        except Exception as e:
+            # e.g. the worker running the job died, or the queue is unreachable
+            logger.error(f"No result for researcher job {job_id}: {job.research_topic[:80]}: {e!r}")
+            return _error_result(e)
+        finally:
+            with self._waiting_lock:
+                self._waiting.pop(job_id, None)
+
+    def close(self) -> None:
+        """Stop the local workers once they finish their current job."""
+        for _ in self.workers:
+            self.job_queue.put_job(None, b"")
+
+
+def _set_result(future: asyncio.Future, payload: bytes) -> None:
+    if not future.done():
+        future.set_result(payload)
+
+
+# Global backend variable - will be initialized lazily
+_researcher_backend = None
+
+
+def create_researcher_backend(backend_name: str) -> ResearcherBackend:
+    """Create the researcher backend named ``backend_name``.
+
+    Raises:
+        ValueError: If the backend name is not supported
+    """
+    if backend_name == "asyncio":
+        return InProcessResearcherBackend()
+    elif backend_name == "process_pool":
+        return ProcessPoolResearcherBackend(researcher_backend_workers)
+    elif backend_name == "queue":
+        return QueueResearcherBackend(LocalJobQueue(), local_workers=researcher_backend_workers)
+    else:
+        raise ValueError(f"Invalid researcher backend: {backend_name}. Must be 'asyncio', 'process_pool' or 'queue'")
+
+
+def get_researcher_backend() -> ResearcherBackend:
+    """Get or initialize the researcher backend selected in the app config."""
+    global _researcher_backend
+    if _researcher_backend is None:
+        backend_name = os.getenv("RESEARCHER_BACKEND", config.get("Researchers", "researcher_backend", fallback="asyncio"))
+        _researcher_backend = create_researcher_backend(backend_name)
+        logger.info(f"Researcher backend created: {backend_name}")
+    return _researcher_backend
@@ -0,0 +1,178 @@
+"""Researcher Jobs Run by the Supervisor.
+
+A researcher job runs ``researcher_agent`` on one topic under a deadline. The researcher
+state is streamed while it runs, so when the deadline is hit the job still knows every
+message gathered so far: it cancels the researcher and, if partial findings are enabled,
+compresses those messages instead of returning nothing.
+
+A researcher failing with an exception (e.g. a provider rate limit) is retried on its own
+with exponential backoff, so one transient error neither ends the supervisor nor reruns the
+other researchers. Once its attempts are exhausted, the job returns a structured error
+instead of raising.
+
+The deadline, the partial-findings switch and the retry policy are read from the
+``researcher_deadline_seconds``, ``researcher_partial_findings``, ``researcher_max_attempts``
+and ``researcher_retry_base_delay`` configurable keys of the run config, falling back to
+``consts.py``.
+"""
+
+import asyncio
+import operator
+import random
+import time
+from typing import Optional
+
+from langchain_core.messages import HumanMessage
+from langchain_core.runnables import RunnableConfig
+from langgraph.graph.message import add_messages
+
+from deep_research import logger
+from deep_research.consts import (
+    researcher_deadline_seconds,
+    researcher_max_attempts,
+    researcher_partial_compression_seconds,
+    researcher_partial_findings,
+    researcher_retry_base_delay,
+    researcher_retry_max_delay,
+)
+from deep_research.graphs.research_agent import researcher_agent
+from deep_research.nodes.research_compress_research import compress_research
+
+# Reducers of the researcher state keys accumulated across node updates, other keys are replaced
+_STATE_REDUCERS = {"researcher_messages": add_messages, "raw_notes": operator.add}
+
+# Prefix of the findings compressed from a researcher stopped at its deadline
+PARTIAL_FINDINGS_NOTE = "[Partial findings: this researcher was stopped at its deadline before finishing]\n\n"
+
+
+def researcher_deadline(config: Optional[RunnableConfig]) -> tuple[float, bool]:
+    """Return the researcher deadline in seconds and whether partial findings are returned, from the run config."""
+    configurable = (config or {}).get("configurable", {})
+    return (
+        configurable.get("researcher_deadline_seconds", researcher_deadline_seconds),
+        configurable.get("researcher_partial_findings", researcher_partial_findings),
+    )
+
+
+def researcher_retry_policy(config: Optional[RunnableConfig]) -> tuple[int, float]:
+    """Return the number of attempts of a failing researcher and the base backoff delay in seconds, from the run config."""
+    configurable = (config or {}).get("configurable", {})
+    return (
+        max(1, configurable.get("researcher_max_attempts", researcher_max_attempts)),
+        configurable.get("researcher_retry_base_delay", researcher_retry_base_delay),
+    )
+
+
+def _backoff_delay(attempt: int, base_delay: float) -> float:
+    # Full jitter, so researchers failing on the same rate limit do not retry in lockstep
+    return random.uniform(0, min(researcher_retry_max_delay, base_delay * 2 ** (attempt - 1)))
+
+
+def _apply_update(researcher_state: dict, update: dict) -> None:
+    for key, value in update.items():
+        if key in _STATE_REDUCERS and key in researcher_state:
+            researcher_state[key] = _STATE_REDUCERS[key](researcher_state[key], value)
+        else:
+            researcher_state[key] = value
+
+
+async def _compress_partial_findings(researcher_state: dict, config: Optional[RunnableConfig]) -> Optional[dict]:
+    # Compress the findings of a researcher stopped at its deadline, or return None if that fails or takes too long
+    try:
+        async with asyncio.timeout(researcher_partial_compression_seconds):
+            partial = await asyncio.to_thread(compress_research, researcher_state, config or {})
+    except Exception as e:
+        logger.warning(f"Could not compress the partial findings of a researcher stopped at its deadline: {e!r}")
+        return None
+    return {**partial, "compressed_research": PARTIAL_FINDINGS_NOTE + partial["compressed_research"]}
+
+
+async def run_researcher(
+    research_topic: str,
+    config: Optional[RunnableConfig] = None,
+    deadline_seconds: float = researcher_deadline_seconds,
+    partial_findings: bool = researcher_partial_findings,
+) -> dict:
+    """Research ``research_topic`` with ``researcher_agent``, stopping it at ``deadline_seconds``.
+
+    Args:
+        research_topic: Topic delegated by the supervisor
+        config: Config of the researcher run
+        deadline_seconds: Maximum duration of the researcher
+        partial_findings: Whether a researcher hitting the deadline returns its findings so far, compressed
+
+    Returns:
+        Researcher output with ``compressed_research`` and ``raw_notes``, plus ``timed_out``
+        and ``seconds``
+    """
+    researcher_input = {"researcher_messages": [HumanMessage(content=research_topic)], "research_topic": research_topic}
+    # Full researcher state, rebuilt from the node updates since the output schema omits the budget counters
+    researcher_state = dict(researcher_input)
+    started_at = time.perf_counter()
+    try:
+        async with asyncio.timeout(deadline_seconds):
+            async for updates in researcher_agent.astream(researcher_input, config=config, stream_mode="updates"):
+                for update in updates.values():
+                    _apply_update(researcher_state, update or {})
+    except TimeoutError:
+        logger.warning(f"Researcher stopped at its {deadline_seconds}s deadline: {research_topic[:80]}")
+        result = None
+        if partial_findings and len(researcher_state["researcher_messages"]) > 1:
+            result = await _compress_partial_findings(researcher_state, config)
+        if result is None:
+            result = {
+                "compressed_research": f"Research on this topic did not finish within its {deadline_seconds}s deadline.",
+                "raw_notes": [],
+            }
+        return {**result, "timed_out": True, "seconds": time.perf_counter() - started_at}
+
+    return {**researcher_state, "timed_out": False, "seconds": time.perf_counter() - started_at}
+
+
+async def run_researcher_with_retry(
+    research_topic: str,
+    config: Optional[RunnableConfig] = None,
+    deadline_seconds: float = researcher_deadline_seconds,
+    partial_findings: bool = researcher_partial_findings,
+    max_attempts: int = researcher_max_attempts,
+    base_delay: float = researcher_retry_base_delay,
+) -> dict:
+    """Run ``run_researcher``, retrying only this topic with exponential backoff when it raises.
+
+    Args:
+        research_topic: Topic delegated by the supervisor
+        config: Config of the researcher run
+        deadline_seconds: Maximum duration of each attempt
+        partial_findings: Whether an attempt hitting the deadline returns its findings so far, compressed
+        max_attempts: Maximum number of attempts
+        base_delay: Backoff delay in seconds after the first failed attempt, doubled after each later one
+
+    Returns:
+        Output of ``run_researcher`` with the number of ``attempts``, or, once attempts are
+        exhausted, an output whose ``error`` holds the type and message of the last exception
+    """
+    started_at = time.perf_counter()
+    for attempt in range(1, max_attempts + 1):
+        try:
+            try:
+                result = await run_researcher(research_topic, config, deadline_seconds, partial_findings)
+            except asyncio.CancelledError as e:
+                # A cancellation raised inside the researcher is a failure, only a cancellation of this job stops it
+                if asyncio.current_task().cancelling():
+                    raise
+                raise RuntimeError(f"Researcher was cancelled: {e!r}") from e
+            return {**result, "attempts": attempt}
+        except Exception as e:
+            if attempt == max_attempts:
+                logger.error(f"Researcher failed after {attempt} attempts: {research_topic[:80]}: {e!r}")
+                return {
+                    "compressed_research": "",
+                    "raw_notes": [],
+                    "error": {"type": type(e).__name__, "message": str(e), "attempts": attempt},
+                    "attempts": attempt,
+                    "timed_out": False,
+                    "seconds": time.perf_counter() - started_at,
+                }
+            delay = _backoff_delay(attempt, base_delay)
+            logger.warning(f"Researcher attempt {attempt}/{max_attempts} failed, retrying in {delay:.1f}s: {e!r}")
+            await asyncio.sleep(delay)
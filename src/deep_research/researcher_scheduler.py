@@ -0,0 +1,134 @@
+"""Bounded Scheduler for the Researchers Launched by the Supervisor.
+
+The supervisor model is asked to delegate at most ``max_concurrent_researchers`` topics
+at once, but nothing stops it from emitting more ConductResearch calls. This module runs
+researcher jobs on a bounded worker pool instead of starting them all at once:
+- a run starts at most its per-run limit of workers, overflow jobs wait in a FIFO queue
+- every worker also holds a slot of a process-wide limit, so concurrent runs in the same
+  process (e.g. a LangGraph server) share one budget of provider calls and memory
+- results are yielded as each researcher finishes, so progress can be reported while
+  slower researchers are still running
+
+The per-run limit is read from the ``max_concurrent_researchers`` configurable of the run
+config, falling back to ``consts.py``.
+"""
+
+import asyncio
+from contextlib import aclosing, asynccontextmanager
+from typing import AsyncIterator, Awaitable, Callable, List, Optional, Sequence, TypeVar
+
+from langchain_core.runnables import RunnableConfig
+
+from deep_research import logger
+from deep_research.consts import max_concurrent_researchers, max_concurrent_researchers_per_process
+
+T = TypeVar("T")
+
+# Process-wide researcher slots, created for the running event loop
+_process_semaphore: Optional[asyncio.Semaphore] = None
+_process_semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def researcher_concurrency_limit(config: Optional[RunnableConfig]) -> int:
+    """Return the per-run researcher concurrency limit from the run config."""
+    return (config or {}).get("configurable", {}).get("max_concurrent_researchers", max_concurrent_researchers)
+
+
+@asynccontextmanager
+async def process_researcher_slot() -> AsyncIterator[None]:
+    """Hold one of the ``max_concurrent_researchers_per_process`` researcher slots of the process."""
+    global _process_semaphore, _process_semaphore_loop
+    loop = asyncio.get_running_loop()
+    if _process_semaphore is None or _process_semaphore_loop is not loop:
+        _process_semaphore = asyncio.Semaphore(max_concurrent_researchers_per_process)
+        _process_semaphore_loop = loop
+    async with _process_semaphore:
+        yield
+
+
+class ResearcherScheduler:
+    """Worker pool running researcher jobs at most ``max_concurrency`` at a time, in FIFO order."""
+
+    def __init__(self, max_concurrency: int = max_concurrent_researchers):
+        self.max_concurrency = max(1, max_concurrency)
+
+    async def as_completed(self, jobs: Sequence[Callable[[], Awaitable[T]]]) -> AsyncIterator[tuple[int, T]]:
+        """Run every job and yield ``(index, result)`` pairs as soon as each job finishes.
+
+        Jobs are coroutine factories, so queued jobs do not start anything before a worker
+        picks them up. An exception in a job is raised to the consumer, and closing the
+        iterator early cancels the jobs still running.
+
+        Args:
+            jobs: Coroutine factories, one per researcher
+
+        Yields:
+            Index of the finished job in ``jobs`` and its result, in completion order
+        """
+        pending: asyncio.Queue[tuple[int, Callable[[], Awaitable[T]]]] = asyncio.Queue()
+        for index, job in enumerate(jobs):
+            pending.put_nowait((index, job))
+        if len(jobs) > self.max_concurrency:
+            logger.info(f"Queued {len(jobs) - self.max_concurrency} researchers over the limit of {self.max_concurrency}")
+
+        finished: asyncio.Queue[tuple[int, Optional[T], Optional[Exception]]] = asyncio.Queue()
+
+        async def worker():
+            while not pending.empty():
+                index, job = pending.get_nowait()
+                outcome = (index, None, RuntimeError("Researcher job stopped before returning a result"))
+                try:
+                    async with process_researcher_slot():
+                        try:
+                            outcome = (index, await job(), None)
+                        except asyncio.CancelledError as e:
+                            # Only a cancellation of the worker itself stops it, one raised by the job is its outcome
+                            if asyncio.current_task().cancelling():
+                                raise
+                            outcome = (index, None, RuntimeError(f"Researcher job was cancelled: {e!r}"))
+                        except Exception as e:
+                            outcome = (index, None, e)
+                finally:
+                    # Always post an outcome, so the consumer never waits for a job that is gone
+                    finished.put_nowait(outcome)
+
+        workers = [asyncio.create_task(worker()) for _ in range(min(self.max_concurrency, len(jobs)))]
+        try:
+            for _ in range(len(jobs)):
+                index, result, error = await self._next_finished(finished, workers)
+                if error is not None:
+                    raise error
+                yield index, result
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    @staticmethod
+    async def _next_finished(finished: asyncio.Queue, workers: List[asyncio.Task]) -> tuple:
+        # Wait for the next outcome, giving up if every worker has stopped without posting one
+        getter = asyncio.ensure_future(finished.get())
+        try:
+            while not getter.done():
+                running = [task for task in workers if not task.done()]
+                if not running and finished.empty():
+                    raise RuntimeError("Researcher workers stopped before finishing their jobs")
+                await asyncio.wait([getter, *running], return_when=asyncio.FIRST_COMPLETED)
+            return getter.result()
+        finally:
+            getter.cancel()
+
+    async def run(self, jobs: Sequence[Callable[[], Awaitable[T]]]) -> List[T]:
+        """Run every job and return their results in the order of ``jobs``.
+
+        Args:
+            jobs: Coroutine factories, one per researcher
+
+        Returns:
+            Job results, in the same order as ``jobs``
+        """
+        results: List[Optional[T]] = [None] * len(jobs)
+        async with aclosing(self.as_completed(jobs)) as completed:
+            async for index, result in completed:
+                results[index] = result
+        return results
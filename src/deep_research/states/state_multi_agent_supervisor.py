@@ -32,6 +32,10 @@ class SupervisorState(TypedDict):
     research_iterations: int = 0
     # Raw unprocessed research notes collected from sub-agent research
     raw_notes: Annotated[list[str], operator.add] = []
+    # Number of researchers not launched because their topic reused findings already in the run
+    researchers_avoided: Annotated[int, operator.add] = 0
+    # Id of the run-wide registry of page summaries shared by the researchers of all supervisor iterations
+    url_registry_id: str
 
 
 @tool
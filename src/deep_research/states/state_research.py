@@ -19,16 +19,19 @@ class ResearcherState(TypedDict):
     """
     State for the research agent containing message history and research metadata.
 
-    This state tracks the researcher's conversation, iteration count for limiting
-    tool calls, the research topic being investigated, compressed findings,
-    and raw research notes for detailed analysis.
+    This state tracks the researcher's conversation, iteration count, tokens and start
+    time for enforcing the research budget, the research topic being investigated,
+    compressed findings, and raw research notes for detailed analysis.
     """
 
     researcher_messages: Annotated[Sequence[BaseMessage], add_messages]
     tool_call_iterations: int
+    tokens_used: int
+    research_started_at: float
     research_topic: str
     compressed_research: str
     raw_notes: Annotated[List[str], operator.add]
+    research_budget: dict
 
 
 class ResearcherOutputState(TypedDict):
@@ -36,12 +39,14 @@ class ResearcherOutputState(TypedDict):
     Output state for the research agent containing final research results.
 
     This represents the final output of the research process with compressed
-    research findings and all raw notes from the research process.
+    research findings, all raw notes from the research process, and the budget
+    caps and usage of the researcher.
     """
 
     compressed_research: str
     raw_notes: Annotated[List[str], operator.add]
     researcher_messages: Annotated[Sequence[BaseMessage], add_messages]
+    research_budget: dict
 
 
 # ===== STRUCTURED OUTPUT SCHEMAS =====
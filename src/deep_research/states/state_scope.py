@@ -38,6 +38,8 @@ class AgentState(MessagesState):
     raw_notes: Annotated[list[str], operator.add] = []
     # Processed and structured notes ready for report generation
     notes: Annotated[list[str], operator.add] = []
+    # Number of researchers not launched because their topic reused findings already in the run
+    researchers_avoided: Annotated[int, operator.add] = 0
     # Final formatted research report
     final_report: str
 
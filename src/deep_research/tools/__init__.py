@@ -1,10 +1,15 @@
+import asyncio
+
 from langchain_mcp_adapters.client import MultiServerMCPClient
 
+from deep_research.tools.mcp_pool import MCPSessionPool
 from deep_research.utils import get_current_dir
 
+MCP_SERVER_NAME = "filesystem"
+
 # MCP server configuration for filesystem access
 mcp_config = {
-    "filesystem": {
+    MCP_SERVER_NAME: {
         "command": "npx",
         "args": [
             "-y",  # Auto-install if needed
@@ -14,8 +19,10 @@ mcp_config = {
         "transport": "stdio",  # Communication via stdin/stdout
     }
 }
-# Global client variable - will be initialized lazily
+# Global client and session pool variables - will be initialized lazily
 _client = None
+_pool = None
+_pool_lock = None
 
 
 def get_mcp_client():
@@ -24,3 +31,44 @@ def get_mcp_client():
     if _client is None:
         _client = MultiServerMCPClient(mcp_config)
     return _client
+
+
+async def get_mcp_pool() -> MCPSessionPool:
+    """Get or start the MCP session pool.
+
+    The lock makes researchers racing the first initialization wait for a single
+    server start instead of spawning one each.
+    """
+    global _pool, _pool_lock
+    if _pool is None:
+        if _pool_lock is None:
+            _pool_lock = asyncio.Lock()
+        async with _pool_lock:
+            if _pool is None:
+                pool = MCPSessionPool(get_mcp_client(), MCP_SERVER_NAME)
+                await pool.start()
+                _pool = pool
+    return _pool
+
+
+async def start_mcp_pool() -> MCPSessionPool:
+    """Start the MCP servers at application startup, so the first research call finds them warm."""
+    return await get_mcp_pool()
+
+
+async def reset_mcp_client() -> None:
+    """Close the MCP session pool and drop the client and its cached tools."""
+    global _client, _pool
+    if _pool is not None:
+        await _pool.close()
+    _client = None
+    _pool = None
+
+
+async def get_mcp_tools() -> list:
+    """Get the MCP tools, discovered once per pool start or server restart.
+
+    The tools run on the pooled sessions, so tool calls reuse warm servers instead of
+    spawning a new one per call.
+    """
+    return (await get_mcp_pool()).tools
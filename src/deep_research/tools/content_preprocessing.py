@@ -0,0 +1,170 @@
+"""Raw Webpage Content Preprocessing.
+
+This module cleans raw webpage content before it is summarized: navigation and
+cookie-banner boilerplate is stripped, whitespace and duplicate lines are collapsed,
+and the result is cut to a hard token budget split into chunks that can be
+summarized concurrently.
+
+Cleanup of large pages is CPU heavy, so the async entry point runs it in a process
+pool to keep the event loop responsive.
+"""
+
+import asyncio
+import re
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import List
+
+from deep_research.consts import (
+    preprocessing_max_workers,
+    preprocessing_process_pool_min_chars,
+    summarization_chunk_tokens,
+    summarization_max_chunks,
+)
+from deep_research.utils import worker_process_context
+
+# Approximate number of characters per token used for budgeting
+CHARS_PER_TOKEN = 4
+
+# Lines matching these patterns are navigation, consent or sharing boilerplate
+_BOILERPLATE_PATTERNS = re.compile(
+    r"^("
+    r"(accept|reject|manage)( all)? cookies?.*|.*\bcookie (policy|settings|preferences)\b.*|.*\bwe use cookies\b.*"
+    r"|skip to (main )?content|(sign|log) ?in|(sign|log) ?out|register|subscribe( now)?|menu|search|home"
+    r"|share( on| this)?( \w+)?|follow us.*|back to top|advertisement|related (posts|articles)"
+    r"|all rights reserved.*|©.*|copyright ©?.*|privacy policy|terms (of (use|service)|and conditions)"
+    r")$",
+    re.IGNORECASE,
+)
+# Markdown lines that only hold images or links, without text of their own
+_LINK_ONLY_LINE = re.compile(r"^(\s*[-*]?\s*!?\[[^\]]*\]\([^)]*\)\s*[|·•]?\s*)+$")
+
+
+def approximate_token_count(text: str) -> int:
+    """Approximate the number of tokens of ``text`` without calling a tokenizer."""
+    return len(text) // CHARS_PER_TOKEN
+
+
+def clean_webpage_content(webpage_content: str) -> str:
+    """Strip boilerplate, collapse whitespace and drop duplicate lines from raw webpage content.
+
+    Args:
+        webpage_content: Raw webpage content
+
+    Returns:
+        Cleaned content, with paragraphs separated by a single blank line
+    """
+    cleaned_lines = []
+    seen_lines = set()
+    previous_blank = True
+
+    for line in webpage_content.splitlines():
+        line = re.sub(r"\s+", " ", line).strip()
+        if not line:
+            if not previous_blank:
+                cleaned_lines.append("")
+            previous_blank = True
+            continue
+
+        normalized = line.lower().strip(" .:|-")
+        if _BOILERPLATE_PATTERNS.match(normalized) or _LINK_ONLY_LINE.match(line) or normalized in seen_lines:
+            continue
+
+        seen_lines.add(normalized)
+        cleaned_lines.append(line)
+        previous_blank = False
+
+    return "\n".join(cleaned_lines).strip()
+
+
+def split_into_chunks(
+    text: str, chunk_tokens: int = summarization_chunk_tokens, max_chunks: int = summarization_max_chunks
+) -> List[str]:
+    """Split text into chunks of at most ``chunk_tokens`` tokens on paragraph boundaries.
+
+    Content beyond ``max_chunks`` chunks is dropped, which enforces the overall token budget.
+
+    Args:
+        text: Cleaned content to split
+        chunk_tokens: Token budget of a single chunk
+        max_chunks: Maximum number of chunks returned
+
+    Returns:
+        List of chunks, in document order
+    """
+    chunk_chars = chunk_tokens * CHARS_PER_TOKEN
+    chunks = []
+    current = ""
+
+    for paragraph in text.split("\n\n"):
+        # Hard-split paragraphs that are larger than a chunk on their own
+        pieces = [paragraph[i : i + chunk_chars] for i in range(0, len(paragraph), chunk_chars)] or [""]
+        for piece in pieces:
+            if current and len(current) + len(piece) + 2 > chunk_chars:
+                chunks.append(current)
+                if len(chunks) == max_chunks:
+                    return chunks
+                current = piece
+            else:
+                current = f"{current}\n\n{piece}" if current else piece
+
+    if current:
+        chunks.append(current)
+    return chunks[:max_chunks]
+
+
+def preprocess_webpage_content(webpage_content: str) -> List[str]:
+    """Clean raw webpage content and split it into chunks within the summarization token budget.
+
+    Args:
+        webpage_content: Raw webpage content
+
+    Returns:
+        List of cleaned chunks, a single chunk for pages within the budget
+    """
+    cleaned_content = clean_webpage_content(webpage_content) or webpage_content
+    return split_into_chunks(cleaned_content)
+
+
+# Global process pool variable - will be initialized lazily
+_process_pool = None
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """Get or initialize the process pool used for CPU heavy preprocessing."""
+    global _process_pool
+    if _process_pool is None:
+        _process_pool = ProcessPoolExecutor(
+            max_workers=preprocessing_max_workers, mp_context=worker_process_context([__name__])
+        )
+    return _process_pool
+
+
+async def apreprocess_webpage_content(webpage_content: str) -> List[str]:
+    """Preprocess webpage content without stalling the event loop.
+
+    Large pages are cleaned in the process pool, small pages inline where the
+    inter-process round trip would cost more than the cleanup itself.
+
+    Args:
+        webpage_content: Raw webpage content
+
+    Returns:
+        List of cleaned chunks, a single chunk for pages within the budget
+
+    Raises:
+        BrokenProcessPool: If a worker process died, the pool is replaced for the next page
+    """
+    global _process_pool
+    if len(webpage_content) < preprocessing_process_pool_min_chars:
+        return preprocess_webpage_content(webpage_content)
+    loop = asyncio.get_running_loop()
+    process_pool = get_process_pool()
+    try:
+        return await loop.run_in_executor(process_pool, preprocess_webpage_content, webpage_content)
+    except BrokenProcessPool:
+        # Drop the broken pool so the next page starts a new one
+        if _process_pool is process_pool:
+            _process_pool = None
+            process_pool.shutdown(wait=False, cancel_futures=True)
+        raise
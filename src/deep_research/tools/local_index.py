@@ -0,0 +1,309 @@
+"""Persistent, Incrementally Maintained Search Index over the Local Research Documents.
+
+The MCP filesystem server can only list and read whole files, which pushes entire
+documents into the researcher's context. This module keeps an inverted BM25 index of
+fixed-size line passages over the local document directory, so researchers can search
+for ranked passages and then read only the line ranges they need.
+
+The postings are stored in SQLite and loaded on demand, so a process start opens the
+existing index instead of re-reading the corpus. ``refresh`` brings the index up to date
+with the documents directory:
+- files whose mtime and size are unchanged are skipped without being read
+- files whose content hash is unchanged only get their mtime and size updated
+- new and modified files are re-indexed, deleted files are dropped
+
+Line byte offsets are recorded at indexing time, and line ranges are read from
+memory-mapped files, so reading a passage costs the same in a small or a huge file.
+"""
+
+import hashlib
+import math
+import mmap
+import sqlite3
+import threading
+import time
+from array import array
+from collections import Counter
+from pathlib import Path
+from typing import Iterator, List, NamedTuple, Optional
+
+from deep_research import APP_ROOT, config, logger
+from deep_research.consts import (
+    bm25_b,
+    bm25_k1,
+    local_document_extensions,
+    local_index_refresh_interval,
+    local_passage_lines,
+)
+from deep_research.tools.relevance import tokenize
+
+# Directory holding the local research documents, shared with the MCP filesystem server
+LOCAL_DOCUMENTS_DIR = APP_ROOT / "files"
+
+
+class Passage(NamedTuple):
+    """Range of lines of a local document, 1-based and inclusive."""
+
+    path: str
+    start_line: int
+    end_line: int
+
+
+def _line_offsets(data: bytes) -> array:
+    """Return the byte offset of the start of every line, followed by the size of the data."""
+    offsets = array("Q", [0])
+    position = data.find(b"\n")
+    while position != -1:
+        offsets.append(position + 1)
+        position = data.find(b"\n", position + 1)
+    if offsets[-1] != len(data):
+        offsets.append(len(data))
+    return offsets
+
+
+def read_mapped_range(path: Path, start: int, end: int) -> str:
+    """Read bytes ``start`` to ``end`` of ``path`` through a memory map."""
+    if end <= start:
+        return ""
+    with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        return mapped[start:end].decode("utf-8", errors="replace")
+
+
+class LocalDocumentIndex:
+    """Inverted BM25 index of line passages over a directory of text documents, persisted in SQLite."""
+
+    def __init__(
+        self,
+        db_path: str | Path = ":memory:",
+        root: Path = LOCAL_DOCUMENTS_DIR,
+        passage_lines: int = local_passage_lines,
+    ):
+        self.root = Path(root).resolve()
+        self.passage_lines = passage_lines
+        self.last_refresh: Optional[float] = None
+        self._line_offsets: dict[str, array] = {}
+        self._lock = threading.RLock()
+
+        if db_path != ":memory:":
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.executescript(
+            "CREATE TABLE IF NOT EXISTS files ("
+            "path TEXT PRIMARY KEY, mtime_ns INTEGER NOT NULL, size INTEGER NOT NULL, "
+            "content_hash TEXT NOT NULL, line_offsets BLOB NOT NULL);"
+            "CREATE TABLE IF NOT EXISTS passages ("
+            "id INTEGER PRIMARY KEY AUTOINCREMENT, path TEXT NOT NULL, start_line INTEGER NOT NULL, "
+            "end_line INTEGER NOT NULL, length INTEGER NOT NULL);"
+            "CREATE INDEX IF NOT EXISTS idx_passages_path ON passages (path);"
+            "CREATE TABLE IF NOT EXISTS postings ("
+            "term TEXT NOT NULL, passage_id INTEGER NOT NULL, frequency INTEGER NOT NULL, "
+            "PRIMARY KEY (term, passage_id)) WITHOUT ROWID;"
+            "CREATE INDEX IF NOT EXISTS idx_postings_passage ON postings (passage_id);"
+        )
+        self._conn.commit()
+        self._load_collection_stats()
+
+    def _load_collection_stats(self) -> None:
+        self.passage_count, self.total_length = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(length), 0) FROM passages"
+        ).fetchone()
+
+    def iter_documents(self) -> Iterator[Path]:
+        """Yield the indexable documents under the root directory."""
+        for path in sorted(self.root.rglob("*")):
+            if path.is_file() and path.suffix.lower() in local_document_extensions:
+                yield path
+
+    def resolve(self, path: str) -> Path:
+        """Resolve a document path relative to the root, refusing paths outside of it.
+
+        Raises:
+            ValueError: If the path escapes the root directory or is not a file
+        """
+        resolved = (self.root / path).resolve()
+        if not resolved.is_relative_to(self.root) or not resolved.is_file():
+            raise ValueError(f"Not a readable document: {path}")
+        return resolved
+
+    def refresh(self) -> dict:
+        """Bring the index up to date with the documents directory.
+
+        Only new, modified and deleted documents are indexed or removed, so the cost is
+        proportional to the change rather than to the corpus size.
+
+        Returns:
+            Number of documents added, updated, touched (same content, new mtime) and removed
+        """
+        changes = {"added": 0, "updated": 0, "touched": 0, "removed": 0}
+        with self._lock:
+            indexed = {
+                path: (mtime_ns, size, content_hash)
+                for path, mtime_ns, size, content_hash in self._conn.execute(
+                    "SELECT path, mtime_ns, size, content_hash FROM files"
+                )
+            }
+            seen = set()
+            for document in self.iter_documents():
+                path = document.relative_to(self.root).as_posix()
+                seen.add(path)
+                stat = document.stat()
+                known = indexed.get(path)
+                if known is not None and known[:2] == (stat.st_mtime_ns, stat.st_size):
+                    continue
+
+                data = document.read_bytes()
+                content_hash = hashlib.sha256(data).hexdigest()
+                if known is not None and known[2] == content_hash:
+                    self._conn.execute(
+                        "UPDATE files SET mtime_ns = ?, size = ? WHERE path = ?", (stat.st_mtime_ns, stat.st_size, path)
+                    )
+                    changes["touched"] += 1
+                    continue
+
+                self._index_file(path, data, content_hash, stat.st_mtime_ns)
+                changes["added" if known is None else "updated"] += 1
+
+            for path in indexed.keys() - seen:
+                self._remove_file(path)
+                changes["removed"] += 1
+
+            self._conn.commit()
+            self._load_collection_stats()
+            self.last_refresh = time.monotonic()
+
+        if any(changes.values()):
+            logger.info(f"Local index refreshed: {changes}, {self.passage_count} passages")
+        return changes
+
+    def refresh_if_stale(self, interval: float = local_index_refresh_interval) -> None:
+        """Refresh the index if it was not refreshed in the last ``interval`` seconds."""
+        if self.last_refresh is None or time.monotonic() - self.last_refresh >= interval:
+            self.refresh()
+
+    def _index_file(self, path: str, data: bytes, content_hash: str, mtime_ns: int) -> None:
+        self._remove_file(path)
+        offsets = _line_offsets(data)
+        self._conn.execute(
+            "INSERT INTO files (path, mtime_ns, size, content_hash, line_offsets) VALUES (?, ?, ?, ?, ?)",
+            (path, mtime_ns, len(data), content_hash, offsets.tobytes()),
+        )
+        self._line_offsets[path] = offsets
+
+        lines = data.decode("utf-8", errors="replace").splitlines()
+        for start in range(0, len(lines), self.passage_lines):
+            tokens = tokenize("\n".join(lines[start : start + self.passage_lines]))
+            if not tokens:
+                continue
+            passage_id = self._conn.execute(
+                "INSERT INTO passages (path, start_line, end_line, length) VALUES (?, ?, ?, ?)",
+                (path, start + 1, min(start + self.passage_lines, len(lines)), len(tokens)),
+            ).lastrowid
+            self._conn.executemany(
+                "INSERT INTO postings (term, passage_id, frequency) VALUES (?, ?, ?)",
+                [(term, passage_id, frequency) for term, frequency in Counter(tokens).items()],
+            )
+
+    def _remove_file(self, path: str) -> None:
+        self._conn.execute("DELETE FROM postings WHERE passage_id IN (SELECT id FROM passages WHERE path = ?)", (path,))
+        self._conn.execute("DELETE FROM passages WHERE path = ?", (path,))
+        self._conn.execute("DELETE FROM files WHERE path = ?", (path,))
+        self._line_offsets.pop(path, None)
+
+    def search(self, query: str, max_results: int) -> List[tuple[Passage, float]]:
+        """Return the passages most relevant to ``query`` with their BM25 scores."""
+        query_terms = sorted(set(tokenize(query)))
+        with self._lock:
+            if not self.passage_count or not query_terms:
+                return []
+            average_length = self.total_length / self.passage_count
+
+            # Only the postings of the query terms are read
+            postings: dict[str, list[tuple[int, int, int]]] = {}
+            for term, passage_id, frequency, length in self._conn.execute(
+                "SELECT term, passage_id, frequency, length FROM postings JOIN passages ON passages.id = passage_id "
+                f"WHERE term IN ({', '.join('?' * len(query_terms))})",
+                query_terms,
+            ):
+                postings.setdefault(term, []).append((passage_id, frequency, length))
+
+            scores: dict[int, float] = {}
+            for term, passage_frequencies in postings.items():
+                idf = math.log(1 + (self.passage_count - len(passage_frequencies) + 0.5) / (len(passage_frequencies) + 0.5))
+                for passage_id, frequency, length in passage_frequencies:
+                    scores[passage_id] = scores.get(passage_id, 0.0) + idf * frequency * (bm25_k1 + 1) / (
+                        frequency + bm25_k1 * (1 - bm25_b + bm25_b * length / average_length)
+                    )
+
+            ranked = sorted(scores.items(), key=lambda item: -item[1])[:max_results]
+            if not ranked:
+                return []
+            passages = {
+                passage_id: Passage(path, start_line, end_line)
+                for passage_id, path, start_line, end_line in self._conn.execute(
+                    f"SELECT id, path, start_line, end_line FROM passages WHERE id IN ({', '.join('?' * len(ranked))})",
+                    [passage_id for passage_id, _ in ranked],
+                )
+            }
+        return [(passages[passage_id], score) for passage_id, score in ranked]
+
+    def _get_line_offsets(self, path: str, resolved: Path) -> array:
+        with self._lock:
+            offsets = self._line_offsets.get(path)
+            if offsets is None:
+                row = self._conn.execute("SELECT line_offsets FROM files WHERE path = ?", (path,)).fetchone()
+                if row is not None:
+                    offsets = array("Q")
+                    offsets.frombytes(row[0])
+                    self._line_offsets[path] = offsets
+        # Documents added or resized since the last refresh are read without the recorded offsets
+        if offsets is None or offsets[-1] != resolved.stat().st_size:
+            offsets = _line_offsets(resolved.read_bytes())
+        return offsets
+
+    def read_lines(self, path: str, start_line: int, end_line: int) -> str:
+        """Read lines ``start_line`` to ``end_line`` (1-based, inclusive) of a document from a memory map."""
+        resolved = self.resolve(path)
+        offsets = self._get_line_offsets(path, resolved)
+        line_count = len(offsets) - 1
+        start_line = max(start_line, 1)
+        end_line = min(end_line, line_count)
+        if start_line > end_line:
+            return ""
+        return read_mapped_range(resolved, offsets[start_line - 1], offsets[end_line])
+
+    def iter_passages(self) -> List[tuple[int, Passage]]:
+        """Return every indexed passage with its id, in id order."""
+        with self._lock:
+            return [
+                (passage_id, Passage(path, start_line, end_line))
+                for passage_id, path, start_line, end_line in self._conn.execute(
+                    "SELECT id, path, start_line, end_line FROM passages ORDER BY id"
+                )
+            ]
+
+    def fingerprint(self) -> tuple[int, int]:
+        """Return the passage count and highest passage id, which change whenever passages are added or removed."""
+        with self._lock:
+            return tuple(self._conn.execute("SELECT COUNT(*), COALESCE(MAX(id), 0) FROM passages").fetchone())
+
+    def stats(self) -> dict:
+        """Return the number of indexed documents, passages and terms."""
+        with self._lock:
+            documents = self._conn.execute("SELECT COUNT(*) FROM files").fetchone()[0]
+            terms = self._conn.execute("SELECT COUNT(DISTINCT term) FROM postings").fetchone()[0]
+        return {"documents": documents, "passages": self.passage_count, "terms": terms}
+
+
+# Global index variable - will be initialized lazily
+_local_index: Optional[LocalDocumentIndex] = None
+_local_index_lock = threading.Lock()
+
+
+def get_local_index() -> LocalDocumentIndex:
+    """Get or open the persisted local document index, once even when several researchers race the first call."""
+    global _local_index
+    if _local_index is None:
+        with _local_index_lock:
+            if _local_index is None:
+                _local_index = LocalDocumentIndex(APP_ROOT / config.get("Paths", "local_index_file"))
+    return _local_index
@@ -0,0 +1,97 @@
+from typing import Annotated
+
+from langchain_core.tools import InjectedToolArg, tool
+
+from deep_research.consts import local_read_max_lines, local_search_max_results
+from deep_research.tools.local_index import LocalDocumentIndex, Passage, get_local_index
+from deep_research.tools.vector_index import get_vector_index
+
+
+def format_passages(index: LocalDocumentIndex, matches: list[tuple[Passage, float]]) -> str:
+    """Format ranked passages with their file paths, line ranges and scores."""
+    formatted_output = "Local document passages:\n\n"
+    for i, (passage, score) in enumerate(matches, 1):
+        formatted_output += (
+            f"\n\n--- PASSAGE {i}: {passage.path} (lines {passage.start_line}-{passage.end_line}, score {score:.2f}) ---\n"
+        )
+        formatted_output += index.read_lines(passage.path, passage.start_line, passage.end_line)
+        formatted_output += "\n\n" + "-" * 80 + "\n"
+    return formatted_output
+
+
+@tool(parse_docstring=True)
+def search_local_documents(
+    query: str,
+    max_results: Annotated[int, InjectedToolArg] = local_search_max_results,
+) -> str:
+    """Search the local research documents and return the most relevant passages.
+
+    Each passage comes with the file path and line range it was taken from, so more
+    context can be read with read_file_range.
+
+    Args:
+        query: Keywords or question to search for
+        max_results: Maximum number of passages to return
+
+    Returns:
+        Ranked passages with their file paths and line ranges
+    """
+    index = get_local_index()
+    index.refresh_if_stale()
+    matches = index.search(query, max_results)
+    if not matches:
+        return f"No local document passages found for query: {query}"
+    return format_passages(index, matches)
+
+
+@tool(parse_docstring=True)
+def semantic_search_local_documents(
+    query: str,
+    max_results: Annotated[int, InjectedToolArg] = local_search_max_results,
+) -> str:
+    """Search the local research documents by similarity of wording rather than exact keywords.
+
+    Use this tool when search_local_documents finds nothing, or to find passages using
+    variants of the query words (e.g. "roasting" for "roaster") or misspellings.
+
+    Args:
+        query: Description of the information to find
+        max_results: Maximum number of passages to return
+
+    Returns:
+        Passages ranked by similarity, with their file paths and line ranges
+    """
+    index = get_local_index()
+    index.refresh_if_stale()
+    vector_index = get_vector_index()
+    vector_index.sync(index)
+    matches = vector_index.search(query, max_results)
+    if not matches:
+        return f"No similar local document passages found for query: {query}"
+    return format_passages(index, matches)
+
+
+@tool(parse_docstring=True)
+def read_file_range(path: str, start_line: int, end_line: int) -> str:
+    """Read a range of lines of a local research document.
+
+    Use this tool to read the context around a passage found with search_local_documents
+    instead of reading the whole file.
+
+    Args:
+        path: Document path relative to the research documents directory, as returned by search_local_documents
+        start_line: First line to read, starting at 1
+        end_line: Last line to read, included
+
+    Returns:
+        The requested lines of the document
+    """
+    end_line = min(end_line, start_line + local_read_max_lines - 1)
+    content = get_local_index().read_lines(path, start_line, end_line)
+    if not content:
+        return f"No lines {start_line}-{end_line} in {path}"
+    return f"{path} (lines {start_line}-{end_line}):\n{content}"
+
+
+# Tools searching and reading the local research documents without going through the MCP server
+local_document_tools = [search_local_documents, semantic_search_local_documents, read_file_range]
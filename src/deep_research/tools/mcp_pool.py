@@ -0,0 +1,225 @@
+"""Warm Pool of MCP Server Sessions.
+
+Without a pool, every MCP tool call opens a new session, which for stdio servers means
+a package resolution and a process spawn. This module keeps a fixed number of
+long-lived sessions to one MCP server:
+- sessions are started once and reused by every researcher
+- each session is handed to one caller at a time, concurrent callers wait in FIFO order
+- a session that fails a health-check ping, or whose transport breaks, is restarted
+- time-to-first-tool and pool utilization are reported by ``stats``
+
+Each session runs in its own background task because MCP transports must be entered
+and exited from the same task.
+"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager, suppress
+from typing import AsyncIterator, Optional
+
+from langchain_core.tools import StructuredTool, ToolException
+from langchain_mcp_adapters.client import MultiServerMCPClient
+from mcp import ClientSession
+from mcp.shared.exceptions import McpError
+
+from deep_research import logger
+from deep_research.consts import (
+    mcp_health_check_interval,
+    mcp_health_check_timeout,
+    mcp_pool_size,
+)
+
+
+class _PooledSession:
+    """Slot of the pool holding one live MCP session and the task keeping it open."""
+
+    def __init__(self, index: int):
+        self.index = index
+        self.session: Optional[ClientSession] = None
+        self.task: Optional[asyncio.Task] = None
+        self.closed = asyncio.Event()
+        self.alive = False
+        self.last_checked = 0.0
+
+
+class MCPSessionPool:
+    """Fixed-size pool of MCP sessions to a single server, with health checks and restarts."""
+
+    def __init__(
+        self,
+        client: MultiServerMCPClient,
+        server_name: str,
+        size: int = mcp_pool_size,
+    ):
+        self.client = client
+        self.server_name = server_name
+        self.size = size
+        self.tools: list[StructuredTool] = []
+        self._slots = [_PooledSession(index) for index in range(size)]
+        self._idle: asyncio.Queue[_PooledSession] = asyncio.Queue()
+
+        # Metrics
+        self.time_to_first_tool: Optional[float] = None
+        self.acquisitions = 0
+        self.in_use = 0
+        self.peak_in_use = 0
+        self.total_wait_seconds = 0.0
+        self.busy_seconds = 0.0
+        self.restarts = 0
+        self._started_at: Optional[float] = None
+
+    async def start(self) -> None:
+        """Start every session and discover the server tools.
+
+        If a session fails to start, the sessions already open are closed before the error
+        is raised, so no server process outlives a failed start.
+        """
+        self._started_at = time.perf_counter()
+        try:
+            results = await asyncio.gather(*(self._open(slot) for slot in self._slots), return_exceptions=True)
+            errors = [result for result in results if isinstance(result, BaseException)]
+            if errors:
+                raise errors[0]
+            await self._discover_tools(self._slots[0].session)
+        except BaseException:
+            await self.close()
+            raise
+        for slot in self._slots:
+            self._idle.put_nowait(slot)
+        self.time_to_first_tool = time.perf_counter() - self._started_at
+        logger.info(
+            f"MCP pool for '{self.server_name}' started {self.size} sessions, "
+            f"{len(self.tools)} tools available after {self.time_to_first_tool:.2f}s"
+        )
+
+    async def close(self) -> None:
+        """Close every session of the pool."""
+        for slot in self._slots:
+            slot.closed.set()
+        await asyncio.gather(*(slot.task for slot in self._slots if slot.task is not None), return_exceptions=True)
+
+    async def _open(self, slot: _PooledSession) -> None:
+        ready = asyncio.Event()
+        slot.closed = asyncio.Event()
+
+        async def keep_open():
+            try:
+                async with self.client.session(self.server_name) as session:
+                    slot.session = session
+                    slot.alive = True
+                    slot.last_checked = time.monotonic()
+                    ready.set()
+                    await slot.closed.wait()
+            except Exception as e:
+                logger.warning(f"MCP session {slot.index} of '{self.server_name}' stopped: {str(e)}")
+            finally:
+                slot.alive = False
+                slot.session = None
+                ready.set()
+
+        slot.task = asyncio.create_task(keep_open())
+        await ready.wait()
+        if not slot.alive:
+            raise RuntimeError(f"Could not start MCP session {slot.index} of '{self.server_name}'")
+
+    async def _restart(self, slot: _PooledSession) -> None:
+        logger.warning(f"Restarting MCP session {slot.index} of '{self.server_name}'")
+        slot.closed.set()
+        if slot.task is not None:
+            with suppress(Exception):
+                await asyncio.wait_for(slot.task, timeout=mcp_health_check_timeout)
+        await self._open(slot)
+        self.restarts += 1
+
+        # The server may come back with a different tool set
+        await self._discover_tools(slot.session)
+
+    async def _is_healthy(self, slot: _PooledSession) -> bool:
+        if not slot.alive:
+            return False
+        if time.monotonic() - slot.last_checked < mcp_health_check_interval:
+            return True
+        try:
+            await asyncio.wait_for(slot.session.send_ping(), timeout=mcp_health_check_timeout)
+        except Exception:
+            return False
+        slot.last_checked = time.monotonic()
+        return True
+
+    @asynccontextmanager
+    async def _acquire(self) -> AsyncIterator[_PooledSession]:
+        requested_at = time.perf_counter()
+        slot = await self._idle.get()
+        acquired_at = time.perf_counter()
+        self.total_wait_seconds += acquired_at - requested_at
+        self.acquisitions += 1
+        self.in_use += 1
+        self.peak_in_use = max(self.peak_in_use, self.in_use)
+        try:
+            if not await self._is_healthy(slot):
+                await self._restart(slot)
+            yield slot
+        finally:
+            self.in_use -= 1
+            self.busy_seconds += time.perf_counter() - acquired_at
+            self._idle.put_nowait(slot)
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[ClientSession]:
+        """Borrow a healthy session for exclusive use, waiting for one to be free."""
+        async with self._acquire() as slot:
+            yield slot.session
+
+    async def call_tool(self, name: str, arguments: dict) -> str:
+        """Call an MCP tool on a pooled session, retrying once on a restarted session if the transport fails.
+
+        Raises:
+            ToolException: If the tool reports an error
+        """
+        for attempt in range(2):
+            async with self._acquire() as slot:
+                try:
+                    result = await slot.session.call_tool(name, arguments)
+                except McpError as e:
+                    raise ToolException(str(e)) from e
+                except Exception as e:
+                    # Broken transport, the session is restarted on its next acquisition
+                    slot.alive = False
+                    if attempt == 1:
+                        raise
+                    logger.warning(f"MCP tool {name} failed on session {slot.index}, retrying: {str(e)}")
+                    continue
+
+            content = "\n".join(getattr(block, "text", None) or str(block) for block in result.content)
+            if result.isError:
+                raise ToolException(content)
+            return content
+
+    async def _discover_tools(self, session: ClientSession) -> None:
+        response = await session.list_tools()
+        self.tools = [self._to_langchain_tool(mcp_tool) for mcp_tool in response.tools]
+
+    def _to_langchain_tool(self, mcp_tool) -> StructuredTool:
+        async def call(**arguments) -> str:
+            return await self.call_tool(mcp_tool.name, arguments)
+
+        return StructuredTool(
+            name=mcp_tool.name,
+            description=mcp_tool.description or "",
+            args_schema=mcp_tool.inputSchema,
+            coroutine=call,
+        )
+
+    def stats(self) -> dict:
+        """Return time-to-first-tool and utilization metrics of the pool."""
+        uptime = time.perf_counter() - self._started_at if self._started_at is not None else 0.0
+        return {
+            "size": self.size,
+            "time_to_first_tool": self.time_to_first_tool,
+            "acquisitions": self.acquisitions,
+            "in_use": self.in_use,
+            "peak_in_use": self.peak_in_use,
+            "average_wait_seconds": self.total_wait_seconds / self.acquisitions if self.acquisitions else 0.0,
+            "utilization": self.busy_seconds / (uptime * self.size) if uptime else 0.0,
+            "restarts": self.restarts,
+        }
@@ -0,0 +1,130 @@
+"""Near-Duplicate Webpage Detection.
+
+URL deduplication misses syndicated articles, mirrors, AMP pages and reposts. This
+module detects them with MinHash signatures over word shingles of the raw content:
+each page is reduced to a compact NumPy array whose element-wise agreement with
+another signature estimates the Jaccard similarity of the two pages. A banded LSH
+index finds candidate duplicates without comparing every pair of pages.
+"""
+
+import re
+import zlib
+from collections import defaultdict
+from typing import Optional
+
+import numpy as np
+
+from deep_research import logger
+from deep_research.consts import (
+    minhash_num_permutations,
+    near_duplicate_max_words,
+    near_duplicate_threshold,
+    shingle_size,
+)
+
+# Mersenne prime used by the universal hash family, small enough for products to fit in uint64
+_MERSENNE_PRIME = np.uint64((1 << 31) - 1)
+_rng = np.random.default_rng(seed=122)
+_HASH_A = _rng.integers(1, (1 << 31) - 1, size=(minhash_num_permutations, 1), dtype=np.uint64)
+_HASH_B = _rng.integers(0, (1 << 31) - 1, size=(minhash_num_permutations, 1), dtype=np.uint64)
+
+# Number of LSH bands, each band holds minhash_num_permutations // _LSH_BANDS signature rows
+_LSH_BANDS = 16
+
+
+def minhash_signature(text: str) -> np.ndarray:
+    """Compute the MinHash signature of the word shingles of ``text``.
+
+    Args:
+        text: Page content
+
+    Returns:
+        Array of ``minhash_num_permutations`` uint32 values
+    """
+    words = re.findall(r"\w+", text.lower())[:near_duplicate_max_words]
+    shingles = {" ".join(words[i : i + shingle_size]) for i in range(max(len(words) - shingle_size + 1, 1))}
+    hashes = np.fromiter((zlib.crc32(shingle.encode("utf-8")) for shingle in shingles), dtype=np.uint64, count=len(shingles))
+    hashes %= _MERSENNE_PRIME
+
+    # Apply every permutation to every shingle at once and keep the minimum per permutation
+    return ((_HASH_A * hashes + _HASH_B) % _MERSENNE_PRIME).min(axis=1).astype(np.uint32)
+
+
+def estimated_similarity(signature_a: np.ndarray, signature_b: np.ndarray) -> float:
+    """Estimate the Jaccard similarity of two pages from their MinHash signatures."""
+    return float(np.mean(signature_a == signature_b))
+
+
+class NearDuplicateIndex:
+    """LSH index mapping each page to the first near-identical page added before it."""
+
+    def __init__(self, threshold: float = near_duplicate_threshold):
+        self.threshold = threshold
+        self.duplicates_found = 0
+        self._signatures: dict[str, np.ndarray] = {}
+        self._buckets: list[defaultdict[bytes, list[str]]] = [defaultdict(list) for _ in range(_LSH_BANDS)]
+
+    def _bands(self, signature: np.ndarray) -> list[bytes]:
+        return [band.tobytes() for band in np.split(signature, _LSH_BANDS)]
+
+    def find(self, signature: np.ndarray) -> Optional[str]:
+        """Return the key of an indexed page near-identical to ``signature``, or None."""
+        candidates = {key for band, bucket in zip(self._bands(signature), self._buckets) for key in bucket.get(band, [])}
+        for key in candidates:
+            if estimated_similarity(signature, self._signatures[key]) >= self.threshold:
+                return key
+        return None
+
+    def add(self, key: str, signature: np.ndarray) -> None:
+        """Index ``signature`` under ``key``."""
+        self._signatures[key] = signature
+        for band, bucket in zip(self._bands(signature), self._buckets):
+            bucket[band].append(key)
+
+    def find_or_add(self, key: str, signature: np.ndarray) -> str:
+        """Return the representative key of a page: an indexed near-duplicate, or ``key`` once indexed."""
+        if key in self._signatures:
+            return key
+        representative = self.find(signature)
+        if representative is not None:
+            self.duplicates_found += 1
+            return representative
+        self.add(key, signature)
+        return key
+
+
+def collapse_near_duplicates(unique_results: dict, run_index: Optional[NearDuplicateIndex] = None) -> dict:
+    """Collapse near-identical raw content to a single representative result.
+
+    Within one search, a result whose raw content is a near-duplicate of an earlier result
+    is dropped. With a run-wide ``run_index``, a result duplicating a page seen earlier in
+    the run is kept and tagged with ``duplicate_of`` so its summary can be reused.
+
+    Args:
+        unique_results: Dictionary of unique search results keyed by URL
+        run_index: Optional index shared by the searches of the current run
+
+    Returns:
+        Dictionary of results without near-duplicates, in the original order
+    """
+    search_index = NearDuplicateIndex()
+    collapsed_results = {}
+
+    for url, result in unique_results.items():
+        if not result.get("raw_content"):
+            collapsed_results[url] = result
+            continue
+
+        signature = minhash_signature(result["raw_content"])
+        if search_index.find_or_add(url, signature) != url:
+            continue
+
+        if run_index is not None:
+            representative = run_index.find_or_add(url, signature)
+            if representative != url:
+                result = {**result, "duplicate_of": representative}
+        collapsed_results[url] = result
+
+    if search_index.duplicates_found:
+        logger.info(f"Collapsed {search_index.duplicates_found} near-duplicate search results")
+    return collapsed_results
@@ -0,0 +1,132 @@
+"""Lexical Relevance Scoring of Search Results.
+
+This module ranks the raw content of search results against the search query with
+BM25, a cheap local alternative to asking the summarization model. Results scoring
+below a relevance threshold keep the short snippet returned by the search API instead
+of going through a full webpage summarization call. The same scorer ranks snippet-only
+results to pick which pages are worth fetching in full.
+"""
+
+import math
+import re
+from collections import Counter
+from typing import List
+
+from deep_research import logger
+from deep_research.consts import bm25_b, bm25_k1, relevance_max_words, relevance_threshold
+
+# Common English words carrying no topical signal
+STOPWORDS = frozenset(
+    "a an and are as at be but by for from has have how in is it its of on or that the their this to was "
+    "were what when where which who why will with".split()
+)
+
+
+def tokenize(text: str, max_words: int | None = None) -> List[str]:
+    """Lowercase ``text`` and split it into word tokens, without stopwords.
+
+    Args:
+        text: Text to tokenize
+        max_words: Optional number of leading words to consider
+
+    Returns:
+        List of tokens in document order
+    """
+    words = re.findall(r"\w+", text.lower())
+    if max_words is not None:
+        words = words[:max_words]
+    return [word for word in words if word not in STOPWORDS]
+
+
+class BM25:
+    """Okapi BM25 scorer over a small in-memory collection of tokenized documents."""
+
+    def __init__(self, documents: List[List[str]], k1: float = bm25_k1, b: float = bm25_b):
+        self.k1 = k1
+        self.b = b
+        self.term_frequencies = [Counter(document) for document in documents]
+        self.document_lengths = [len(document) for document in documents]
+        self.average_length = sum(self.document_lengths) / len(documents) if documents else 0.0
+        document_frequencies = Counter(term for frequencies in self.term_frequencies for term in frequencies)
+        # Smoothed IDF, always positive even for terms present in every document
+        self.idf = {
+            term: math.log(1 + (len(documents) - frequency + 0.5) / (frequency + 0.5))
+            for term, frequency in document_frequencies.items()
+        }
+
+    def score(self, query: List[str], index: int) -> float:
+        """Return the BM25 score of the document at ``index`` for the tokenized ``query``."""
+        frequencies = self.term_frequencies[index]
+        length_ratio = self.document_lengths[index] / self.average_length if self.average_length else 0.0
+        score = 0.0
+        for term in query:
+            frequency = frequencies.get(term, 0)
+            if frequency:
+                score += (
+                    self.idf[term] * frequency * (self.k1 + 1) / (frequency + self.k1 * (1 - self.b + self.b * length_ratio))
+                )
+        return score
+
+    def normalized_score(self, query: List[str], index: int) -> float:
+        """Return the BM25 score divided by the score of a document saturating every query term, in [0, 1).
+
+        Query terms found in no document of the collection are left out of the saturating
+        score, so extra query words no page contains do not push every page down.
+        """
+        best_score = sum(self.idf[term] * (self.k1 + 1) for term in query if term in self.idf)
+        return self.score(query, index) / best_score if best_score else 0.0
+
+def filter_relevant_results(unique_results: dict, query: str, threshold: float = relevance_threshold) -> dict:
+    """Drop the raw content of results whose relevance to ``query`` is below ``threshold``.
+
+    Results losing their raw content are rendered from the search API snippet, so the
+    tool output format is unchanged while their summarization call is skipped. The most
+    relevant result keeps its raw content whatever its score.
+
+    Args:
+        unique_results: Dictionary of unique search results keyed by URL
+        query: Search query the results were retrieved for
+        threshold: Minimum normalized BM25 score for a result to be summarized
+
+    Returns:
+        Dictionary of results, in the original order
+    """
+    query_tokens = tokenize(query)
+    urls_with_content = [url for url, result in unique_results.items() if result.get("raw_content")]
+    if not query_tokens or not urls_with_content:
+        return unique_results
+
+    bm25 = BM25([tokenize(unique_results[url]["raw_content"], max_words=relevance_max_words) for url in urls_with_content])
+    scores = [bm25.normalized_score(query_tokens, index) for index in range(len(urls_with_content))]
+    # The most relevant result is always summarized, even below the threshold
+    best_index = max(range(len(scores)), key=scores.__getitem__)
+    filtered_results = dict(unique_results)
+    skipped = 0
+    for index, url in enumerate(urls_with_content):
+        if scores[index] < threshold and index != best_index:
+            filtered_results[url] = {**unique_results[url], "raw_content": None}
+            skipped += 1
+
+    if skipped:
+        logger.info(f"Skipped summarization of {skipped} low-relevance search results for query: {query}")
+    return filtered_results
+
+
+def rank_results(unique_results: dict, query: str) -> List[str]:
+    """Rank search results by the BM25 relevance of their title and snippet to ``query``.
+
+    Args:
+        unique_results: Dictionary of unique search results keyed by URL
+        query: Search query the results were retrieved for
+
+    Returns:
+        URLs sorted from most to least relevant, ties keeping the search API order
+    """
+    urls = list(unique_results)
+    query_tokens = tokenize(query)
+    if not query_tokens or not urls:
+        return urls
+
+    bm25 = BM25([tokenize(f"{unique_results[url]['title']} {unique_results[url]['content']}") for url in urls])
+    scores = [bm25.score(query_tokens, index) for index in range(len(urls))]
+    return [urls[index] for index in sorted(range(len(urls)), key=lambda index: -scores[index])]
@@ -0,0 +1,255 @@
+"""Pluggable Search Backends.
+
+The search tools talk to a ``SearchBackend`` instead of a hard-wired Tavily client, so
+the research loop can be benchmarked and load-tested without network access or API
+spend. Three implementations are available:
+- ``TavilySearchBackend``: the Tavily search and extract APIs
+- ``ReplaySearchBackend``: recorded responses served from disk, optionally recording
+  missing ones from an upstream backend
+- ``SyntheticSearchBackend``: generated pages of configurable size and latency
+
+The backend is selected with ``SEARCH_BACKEND`` in the app config, or the environment
+variable of the same name.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import random
+import re
+import time
+from pathlib import Path
+from typing import List, Optional, Protocol
+
+from deep_research import APP_ROOT, config, logger
+from deep_research.tools.search_cache import SearchCache
+
+
+class SearchBackend(Protocol):
+    """Interface of the search providers used by the search tools."""
+
+    def search(self, query: str, max_results: int, topic: str, include_raw_content: bool) -> dict:
+        """Search ``query`` and return a response with a ``results`` list."""
+        ...
+
+    async def asearch(self, query: str, max_results: int, topic: str, include_raw_content: bool) -> dict:
+        """Async counterpart of ``search``."""
+        ...
+
+    def extract(self, urls: List[str]) -> dict:
+        """Fetch the raw content of ``urls`` and return a response with a ``results`` list."""
+        ...
+
+    async def aextract(self, urls: List[str]) -> dict:
+        """Async counterpart of ``extract``."""
+        ...
+
+
+class TavilySearchBackend:
+    """Backend calling the Tavily search and extract APIs."""
+
+    def __init__(self):
+        from tavily import AsyncTavilyClient, TavilyClient
+
+        self.client = TavilyClient()
+        self.async_client = AsyncTavilyClient()
+
+    def search(self, query: str, max_results: int, topic: str, include_raw_content: bool) -> dict:
+        """Search ``query`` with the Tavily API."""
+        return self.client.search(query, max_results=max_results, include_raw_content=include_raw_content, topic=topic)
+
+    async def asearch(self, query: str, max_results: int, topic: str, include_raw_content: bool) -> dict:
+        """Search ``query`` with the async Tavily client."""
+        return await self.async_client.search(
+            query, max_results=max_results, include_raw_content=include_raw_content, topic=topic
+        )
+
+    def extract(self, urls: List[str]) -> dict:
+        """Fetch the raw content of ``urls`` with the Tavily extract API."""
+        return self.client.extract(urls=urls)
+
+    async def aextract(self, urls: List[str]) -> dict:
+        """Fetch the raw content of ``urls`` with the async Tavily client."""
+        return await self.async_client.extract(urls=urls)
+
+
+class ReplaySearchBackend:
+    """Backend serving recorded responses from a fixture directory.
+
+    Search responses are stored under ``search/<key>.json`` where the key is the search cache
+    key, and extractions under ``extract/<url hash>.json``. When an ``upstream`` backend is
+    given, missing fixtures are fetched from it and recorded.
+    """
+
+    def __init__(self, fixture_dir: str | Path, upstream: Optional[SearchBackend] = None):
+        self.fixture_dir = Path(fixture_dir)
+        self.upstream = upstream
+
+    def _search_path(self, query: str, max_results: int, topic: str, include_raw_content: bool) -> Path:
+        return self.fixture_dir / "search" / f"{SearchCache.make_key(query, max_results, topic, include_raw_content)}.json"
+
+    def _extract_path(self, url: str) -> Path:
+        return self.fixture_dir / "extract" / f"{hashlib.sha256(url.encode('utf-8')).hexdigest()}.json"
+
+    @staticmethod
+    def _load(path: Path) -> Optional[dict]:
+        if not path.exists():
+            return None
+        return json.loads(path.read_text(encoding="utf-8"))
+
+    @staticmethod
+    def _record(path: Path, response: dict) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(response), encoding="utf-8")
+
+    def search(self, query: str, max_results: int, topic: str, include_raw_content: bool) -> dict:
+        """Serve the recorded response of a search, recording it from upstream if missing."""
+        path = self._search_path(query, max_results, topic, include_raw_content)
+        response = self._load(path)
+        if response is None:
+            if self.upstream is None:
+                logger.warning(f"No recorded search response for query: {query}")
+                return {"query": query, "results": []}
+            response = self.upstream.search(query, max_results, topic, include_raw_content)
+            self._record(path, response)
+        return response
+
+    async def asearch(self, query: str, max_results: int, topic: str, include_raw_content: bool) -> dict:
+        """Serve the recorded response of a search, recording it from upstream if missing."""
+        path = self._search_path(query, max_results, topic, include_raw_content)
+        response = self._load(path)
+        if response is None:
+            if self.upstream is None:
+                logger.warning(f"No recorded search response for query: {query}")
+                return {"query": query, "results": []}
+            response = await self.upstream.asearch(query, max_results, topic, include_raw_content)
+            self._record(path, response)
+        return response
+
+    def _split_recorded(self, urls: List[str]) -> tuple[list[dict], list[str]]:
+        results, missing_urls = [], []
+        for url in urls:
+            recorded = self._load(self._extract_path(url))
+            if recorded is None:
+                missing_urls.append(url)
+            else:
+                results.append(recorded)
+        return results, missing_urls
+
+    def _record_extracted(self, response: dict) -> list[dict]:
+        for result in response.get("results", []):
+            self._record(self._extract_path(result["url"]), result)
+        return response.get("results", [])
+
+    def extract(self, urls: List[str]) -> dict:
+        """Serve the recorded raw content of ``urls``, recording missing ones from upstream."""
+        results, missing_urls = self._split_recorded(urls)
+        if missing_urls and self.upstream is not None:
+            results += self._record_extracted(self.upstream.extract(missing_urls))
+        return {"results": results}
+
+    async def aextract(self, urls: List[str]) -> dict:
+        """Serve the recorded raw content of ``urls``, recording missing ones from upstream."""
+        results, missing_urls = self._split_recorded(urls)
+        if missing_urls and self.upstream is not None:
+            results += self._record_extracted(await self.upstream.aextract(missing_urls))
+        return {"results": results}
+
+
+class SyntheticSearchBackend:
+    """Backend generating deterministic pages of configurable size, with simulated latency.
+
+    Pages are built from the query terms and a filler vocabulary, seeded by the query, so
+    identical queries return identical pages.
+    """
+
+    VOCABULARY = (
+        "analysis report market study data growth review quality method result source expert survey trend "
+        "sample price region customer product service evidence comparison ranking industry average annual"
+    ).split()
+
+    def __init__(self, page_chars: int = 20000, latency_seconds: float = 0.0):
+        self.page_chars = page_chars
+        self.latency_seconds = latency_seconds
+
+    def _page(self, seed: str) -> str:
+        rng = random.Random(seed)
+        terms = re.findall(r"\w+", seed.lower()) + self.VOCABULARY
+        paragraphs, size = [], 0
+        while size < self.page_chars:
+            paragraph = " ".join(rng.choice(terms) for _ in range(rng.randint(40, 120))).capitalize() + "."
+            paragraphs.append(paragraph)
+            size += len(paragraph) + 2
+        return "\n\n".join(paragraphs)[: self.page_chars]
+
+    def _search_response(self, query: str, max_results: int, include_raw_content: bool) -> dict:
+        slug = re.sub(r"\W+", "-", query.lower()).strip("-")
+        results = []
+        for rank in range(max_results):
+            url = f"https://synthetic.local/{slug}/{rank}"
+            page = self._page(url)
+            results.append(
+                {
+                    "url": url,
+                    "title": f"{query} ({rank + 1})",
+                    "content": page[:300],
+                    "score": 1.0 / (rank + 1),
+                    "raw_content": page if include_raw_content else None,
+                }
+            )
+        return {"query": query, "results": results}
+
+    def search(self, query: str, max_results: int, topic: str, include_raw_content: bool) -> dict:
+        """Generate a search response for ``query``."""
+        time.sleep(self.latency_seconds)
+        return self._search_response(query, max_results, include_raw_content)
+
+    async def asearch(self, query: str, max_results: int, topic: str, include_raw_content: bool) -> dict:
+        """Generate a search response for ``query`` without blocking the event loop."""
+        await asyncio.sleep(self.latency_seconds)
+        return self._search_response(query, max_results, include_raw_content)
+
+    def extract(self, urls: List[str]) -> dict:
+        """Generate the raw content of ``urls``."""
+        time.sleep(self.latency_seconds)
+        return {"results": [{"url": url, "raw_content": self._page(url)} for url in urls]}
+
+    async def aextract(self, urls: List[str]) -> dict:
+        """Generate the raw content of ``urls`` without blocking the event loop."""
+        await asyncio.sleep(self.latency_seconds)
+        return {"results": [{"url": url, "raw_content": self._page(url)} for url in urls]}
+
+
+# Global backend variable - will be initialized lazily
+_search_backend = None
+
+
+def create_search_backend(backend_name: str) -> SearchBackend:
+    """Create the search backend named ``backend_name`` from the app config.
+
+    Raises:
+        ValueError: If the backend name is not supported
+    """
+    if backend_name == "tavily":
+        return TavilySearchBackend()
+    elif backend_name == "replay":
+        upstream = TavilySearchBackend() if config.getboolean("Search", "replay_record", fallback=False) else None
+        return ReplaySearchBackend(APP_ROOT / config.get("Paths", "replay_dir"), upstream=upstream)
+    elif backend_name == "synthetic":
+        return SyntheticSearchBackend(
+            page_chars=config.getint("Search", "synthetic_page_chars", fallback=20000),
+            latency_seconds=config.getfloat("Search", "synthetic_latency_seconds", fallback=0.0),
+        )
+    else:
+        raise ValueError(f"Invalid search backend: {backend_name}. Must be 'tavily', 'replay' or 'synthetic'")
+
+
+def get_search_backend() -> SearchBackend:
+    """Get or initialize the search backend selected in the app config."""
+    global _search_backend
+    if _search_backend is None:
+        backend_name = os.getenv("SEARCH_BACKEND", config.get("Search", "search_backend", fallback="tavily"))
+        _search_backend = create_search_backend(backend_name)
+        logger.info(f"Search backend created: {backend_name}")
+    return _search_backend
@@ -0,0 +1,185 @@
+"""TTL-Based Cache for Raw Search API Responses.
+
+This module caches raw search responses keyed by the normalized query and the
+search parameters, so that near-identical queries issued by parallel researchers
+are served without hitting the search API. Entries expire after a per-topic TTL
+and are stored in a pluggable backend: an in-memory LRU or a local SQLite file.
+"""
+
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Protocol
+
+from deep_research import APP_ROOT, config
+from deep_research.consts import search_cache_max_entries, search_cache_ttl_seconds
+
+
+class SearchCacheBackend(Protocol):
+    """Storage interface for cached search responses."""
+
+    def get(self, key: str) -> Optional[dict]:
+        """Return the non-expired response stored under ``key``, or None."""
+        ...
+
+    def set(self, key: str, response: dict, ttl: float) -> None:
+        """Store ``response`` under ``key`` for ``ttl`` seconds."""
+        ...
+
+    def clear(self) -> None:
+        """Remove every stored response."""
+        ...
+
+
+class InMemoryLRUBackend:
+    """Process-local LRU backend with per-entry expiry."""
+
+    def __init__(self, max_entries: int = search_cache_max_entries):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[dict]:
+        """Return the non-expired response stored under ``key``, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, response = entry
+            if expires_at < time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return response
+
+    def set(self, key: str, response: dict, ttl: float) -> None:
+        """Store ``response`` under ``key`` for ``ttl`` seconds."""
+        with self._lock:
+            self._entries[key] = (time.time() + ttl, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove every stored response."""
+        with self._lock:
+            self._entries.clear()
+
+
+class SQLiteBackend:
+    """Local SQLite file backend shared across processes and runs."""
+
+    def __init__(self, db_path: str | Path, max_entries: int = search_cache_max_entries):
+        self.db_path = Path(db_path)
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS search_responses ("
+            "key TEXT PRIMARY KEY, response TEXT NOT NULL, expires_at REAL NOT NULL, last_access REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[dict]:
+        """Return the non-expired response stored under ``key``, or None."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT response, expires_at FROM search_responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            if row[1] < now:
+                self._conn.execute("DELETE FROM search_responses WHERE key = ?", (key,))
+                self._conn.commit()
+                return None
+            self._conn.execute("UPDATE search_responses SET last_access = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            return json.loads(row[0])
+
+    def set(self, key: str, response: dict, ttl: float) -> None:
+        """Store ``response`` under ``key`` for ``ttl`` seconds."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO search_responses (key, response, expires_at, last_access) VALUES (?, ?, ?, ?)",
+                (key, json.dumps(response), now + ttl, now),
+            )
+            # Drop expired entries first, then the least recently used ones over the bound
+            self._conn.execute("DELETE FROM search_responses WHERE expires_at < ?", (now,))
+            self._conn.execute(
+                "DELETE FROM search_responses WHERE key IN ("
+                "SELECT key FROM search_responses ORDER BY last_access DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+            self._conn.commit()
+
+    def clear(self) -> None:
+        """Remove every stored response."""
+        with self._lock:
+            self._conn.execute("DELETE FROM search_responses")
+            self._conn.commit()
+
+
+class SearchCache:
+    """Search response cache with per-topic TTLs on top of a pluggable backend."""
+
+    def __init__(self, backend: SearchCacheBackend, ttl_by_topic: Optional[dict[str, float]] = None):
+        self.backend = backend
+        self.ttl_by_topic = ttl_by_topic or search_cache_ttl_seconds
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def normalize_query(query: str) -> str:
+        """Normalize a query so trivially different spellings share a cache entry."""
+        return re.sub(r"\s+", " ", query.lower()).strip().rstrip("?.!")
+
+    @classmethod
+    def make_key(cls, query: str, max_results: int, topic: str, include_raw_content: bool) -> str:
+        """Build the cache key from the normalized query and the search parameters."""
+        payload = json.dumps([cls.normalize_query(query), max_results, topic, include_raw_content])
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, query: str, max_results: int, topic: str, include_raw_content: bool) -> Optional[dict]:
+        """Return the cached response for a search, or None on a miss or expired entry."""
+        response = self.backend.get(self.make_key(query, max_results, topic, include_raw_content))
+        if response is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return response
+
+    def set(self, query: str, max_results: int, topic: str, include_raw_content: bool, response: dict) -> None:
+        """Cache a search response using the TTL configured for its topic."""
+        ttl = self.ttl_by_topic.get(topic, self.ttl_by_topic["general"])
+        self.backend.set(self.make_key(query, max_results, topic, include_raw_content), response, ttl)
+
+    def stats(self) -> dict:
+        """Return hit/miss counters."""
+        lookups = self.hits + self.misses
+        return {"hits": self.hits, "misses": self.misses, "hit_rate": self.hits / lookups if lookups else 0.0}
+
+
+# Global cache variable - will be initialized lazily
+_search_cache = None
+
+
+def get_search_cache() -> SearchCache:
+    """Get or initialize the search cache lazily with the backend selected in the app config."""
+    global _search_cache
+    if _search_cache is None:
+        backend_name = config.get("Search", "search_cache_backend", fallback="memory")
+        if backend_name == "sqlite":
+            backend = SQLiteBackend(APP_ROOT / config.get("Paths", "search_cache_file"))
+        elif backend_name == "memory":
+            backend = InMemoryLRUBackend()
+        else:
+            raise ValueError(f"Invalid search cache backend: {backend_name}. Must be 'memory' or 'sqlite'")
+        _search_cache = SearchCache(backend)
+    return _search_cache
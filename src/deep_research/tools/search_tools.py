@@ -1,15 +1,35 @@
-from langchain_core.messages import HumanMessage
-from langchain_core.tools import InjectedToolArg, tool
-from tavily import TavilyClient
-from typing_extensions import Annotated, List, Literal
+import asyncio
 
-from deep_research.chains import summarization_model
+from langchain_core.messages import HumanMessage
+from langchain_core.runnables import RunnableLambda
+from langchain_core.tools import InjectedToolArg, StructuredTool
+from typing_extensions import Annotated, List, Literal, Optional
+
+from deep_research import logger
+from deep_research.chains import SUMMARIZATION_MODEL, summarization_model
+from deep_research.chains.runnable_registry import get_structured_model
+from deep_research.consts import (
+    max_concurrent_search_queries,
+    max_concurrent_summarizations,
+    search_query_timeout,
+    two_phase_search,
+    two_phase_top_k,
+)
 from deep_research.prompts import summarize_webpage_prompt
 from deep_research.states.state_research import Summary
+from deep_research.tools.content_preprocessing import (
+    apreprocess_webpage_content,
+    preprocess_webpage_content,
+)
+from deep_research.tools.near_duplicates import collapse_near_duplicates
+from deep_research.tools.relevance import filter_relevant_results, rank_results
+from deep_research.tools.search_backends import get_search_backend
+from deep_research.tools.search_cache import get_search_cache
+from deep_research.tools.summary_cache import SummaryCache, get_summary_cache
+from deep_research.tools.url_registry import get_url_registry
 from deep_research.utils import get_today_str
 
 # model_name =  "ibm:openai/gpt-oss-120b"
-tavily_client = TavilyClient()
 
 
 def tavily_search_multiple(
@@ -18,7 +38,7 @@ def tavily_search_multiple(
     topic: Literal["general", "news", "finance"] = "general",
     include_raw_content: bool = True,
 ) -> List[dict]:
-    """Perform search using Tavily API for multiple queries.
+    """Perform search using the configured search backend for multiple queries.
 
     Args:
         search_queries: List of search queries to execute
@@ -29,44 +49,255 @@ def tavily_search_multiple(
     Returns:
         List of search result dictionaries
     """
+    search_backend = get_search_backend()
+    search_cache = get_search_cache()
 
-    # Execute searches sequentially. Note: yon can use AsyncTavilyClient to parallelize this step.
+    # Execute searches sequentially. See atavily_search_multiple for the concurrent version.
     search_docs = []
     for query in search_queries:
-        result = tavily_client.search(query, max_results=max_results, include_raw_content=include_raw_content, topic=topic)
+        result = search_cache.get(query, max_results, topic, include_raw_content)
+        if result is None:
+            result = search_backend.search(query, max_results, topic, include_raw_content)
+            search_cache.set(query, max_results, topic, include_raw_content, result)
         search_docs.append(result)
 
     return search_docs
 
 
+async def atavily_search_multiple(
+    search_queries: List[str],
+    max_results: int = 3,
+    topic: Literal["general", "news", "finance"] = "general",
+    include_raw_content: bool = True,
+    max_concurrency: int = max_concurrent_search_queries,
+    timeout: float = search_query_timeout,
+) -> List[dict]:
+    """Perform concurrent searches using the configured search backend for multiple queries.
+
+    All queries are sent at once, bounded by ``max_concurrency``. A query that fails or
+    exceeds ``timeout`` seconds yields an empty result set instead of failing the batch.
+    Queries found in the search cache are not sent.
+
+    Args:
+        search_queries: List of search queries to execute
+        max_results: Maximum number of results per query
+        topic: Topic filter for search results
+        include_raw_content: Whether to include raw webpage content
+        max_concurrency: Maximum number of queries in flight at the same time
+        timeout: Timeout in seconds for each individual query
+
+    Returns:
+        List of search result dictionaries, in the same order as ``search_queries``
+    """
+    search_backend = get_search_backend()
+    search_cache = get_search_cache()
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def search(query: str) -> dict:
+        cached_result = search_cache.get(query, max_results, topic, include_raw_content)
+        if cached_result is not None:
+            return cached_result
+
+        async with semaphore:
+            try:
+                result = await asyncio.wait_for(
+                    search_backend.asearch(query, max_results, topic, include_raw_content), timeout=timeout
+                )
+                search_cache.set(query, max_results, topic, include_raw_content, result)
+                return result
+            except asyncio.TimeoutError:
+                logger.warning(f"Search timed out after {timeout}s for query: {query}")
+            except Exception as e:
+                logger.warning(f"Search failed for query '{query}': {str(e)}")
+            return {"query": query, "results": []}
+
+    return await asyncio.gather(*(search(query) for query in search_queries))
+
+
+def _summarization_messages(webpage_content: str) -> list[HumanMessage]:
+    """Build the summarization prompt for a single webpage."""
+    return [HumanMessage(content=summarize_webpage_prompt.format(webpage_content=webpage_content, date=get_today_str()))]
+
+
+def _format_summary(summary: Summary) -> str:
+    """Format a structured summary with clear structure."""
+    return f"<summary>\n{summary.summary}\n</summary>\n\n" f"<key_excerpts>\n{summary.key_excerpts}\n</key_excerpts>"
+
+
+def _merge_summaries(summaries: List[Summary]) -> Summary:
+    """Merge the partial summaries of a chunked webpage into a single summary."""
+    if len(summaries) == 1:
+        return summaries[0]
+    return Summary(
+        summary="\n\n".join(summary.summary for summary in summaries),
+        key_excerpts="\n".join(summary.key_excerpts for summary in summaries),
+    )
+
+
+def _truncate_content(webpage_content: str) -> str:
+    """Fallback used when a webpage could not be summarized."""
+    return webpage_content[:1000] + "..." if len(webpage_content) > 1000 else webpage_content
+
+
+def _summary_cache_key(webpage_content: str) -> str:
+    """Key a summary on the page content, the summarization model and the summarization prompt."""
+    return SummaryCache.make_key(webpage_content, SUMMARIZATION_MODEL, summarize_webpage_prompt)
+
+
+def _cached_summary(cache_key: str) -> Optional[str]:
+    """Return the cached summary for ``cache_key``, a failing cache (e.g. a locked database) counting as a miss."""
+    try:
+        return get_summary_cache().get(cache_key)
+    except Exception as e:
+        logger.warning(f"Failed to read the summary cache: {str(e)}")
+        return None
+
+
+def _cache_summary(cache_key: str, summary: str) -> None:
+    """Store a summary in the cache, a failing cache only costing the reuse of the summary."""
+    try:
+        get_summary_cache().set(cache_key, summary)
+    except Exception as e:
+        logger.warning(f"Failed to write the summary cache: {str(e)}")
+
+
 def summarize_webpage_content(webpage_content: str) -> str:
     """Summarize webpage content using the configured summarization model.
 
+    Summaries are served from the persistent summary cache when the same content was
+    already summarized with the same model and prompt. Otherwise the content is cleaned,
+    and pages over the token budget are summarized chunk by chunk before being merged.
+
     Args:
         webpage_content: Raw webpage content to summarize
 
     Returns:
         Formatted summary with key excerpts
     """
+    cache_key = _summary_cache_key(webpage_content)
+    cached_summary = _cached_summary(cache_key)
+    if cached_summary is not None:
+        return cached_summary
+
+    # Strip boilerplate and split the page within the token budget
+    chunks = preprocess_webpage_content(webpage_content)
+
     try:
         # Set up structured output model for summarization
-        structured_model = summarization_model.with_structured_output(Summary)
+        structured_model = get_structured_model(summarization_model, Summary)
 
-        # Generate summary
-        summary = structured_model.invoke(
-            [HumanMessage(content=summarize_webpage_prompt.format(webpage_content=webpage_content, date=get_today_str()))]
-        )
+        # Generate one summary per chunk and merge them
+        summaries = structured_model.batch([_summarization_messages(chunk) for chunk in chunks])
 
-        # Format summary with clear structure
-        formatted_summary = (
-            f"<summary>\n{summary.summary}\n</summary>\n\n" f"<key_excerpts>\n{summary.key_excerpts}\n</key_excerpts>"
-        )
+        formatted_summary = _format_summary(_merge_summaries(summaries))
+
+    except Exception as e:
+        logger.warning(f"Failed to summarize webpage: {str(e)}")
+        return _truncate_content(chunks[0])
+
+    _cache_summary(cache_key, formatted_summary)
+    return formatted_summary
+
+
+async def asummarize_webpage_content(webpage_content: str) -> str:
+    """Summarize webpage content asynchronously using the configured summarization model.
+
+    Chunks of pages over the token budget are summarized concurrently, and the cleanup of
+    large pages runs in a process pool.
+
+    Args:
+        webpage_content: Raw webpage content to summarize
+
+    Returns:
+        Formatted summary with key excerpts, or the truncated content if summarization fails
+    """
+    # Cache reads and writes block on SQLite, they run off the event loop
+    cache_key = _summary_cache_key(webpage_content)
+    cached_summary = await asyncio.to_thread(_cached_summary, cache_key)
+    if cached_summary is not None:
+        return cached_summary
 
-        return formatted_summary
+    try:
+        chunks = await apreprocess_webpage_content(webpage_content)
+    except Exception as e:
+        logger.warning(f"Failed to preprocess webpage: {e!r}")
+        return _truncate_content(webpage_content)
+
+    try:
+        structured_model = get_structured_model(summarization_model, Summary)
+        summaries = await structured_model.abatch([_summarization_messages(chunk) for chunk in chunks])
+        formatted_summary = _format_summary(_merge_summaries(summaries))
 
     except Exception as e:
-        print(f"Failed to summarize webpage: {str(e)}")
-        return webpage_content[:1000] + "..." if len(webpage_content) > 1000 else webpage_content
+        logger.warning(f"Failed to summarize webpage: {str(e)}")
+        return _truncate_content(chunks[0])
+
+    await asyncio.to_thread(_cache_summary, cache_key, formatted_summary)
+    return formatted_summary
+
+
+def _attach_raw_content(unique_results: dict, raw_contents: dict) -> dict:
+    """Attach extracted raw content to the results, results without extracted content keep their snippet."""
+    return {url: {**result, "raw_content": raw_contents.get(url)} for url, result in unique_results.items()}
+
+
+def fetch_top_raw_content(unique_results: dict, query: str, top_k: int = two_phase_top_k) -> dict:
+    """Fetch raw content only for the ``top_k`` results most relevant to ``query``.
+
+    Second phase of a two-phase search: results were retrieved without raw content, and
+    only the selected URLs are extracted. Extraction failures leave the snippets in place.
+
+    Args:
+        unique_results: Dictionary of unique search results fetched without raw content
+        query: Search query the results were retrieved for
+        top_k: Number of results to fetch raw content for
+
+    Returns:
+        Dictionary of results with raw content for the selected URLs
+    """
+    top_urls = rank_results(unique_results, query)[:top_k]
+    if not top_urls:
+        return unique_results
+
+    try:
+        response = get_search_backend().extract(top_urls)
+        raw_contents = {result["url"]: result.get("raw_content") for result in response.get("results", [])}
+    except Exception as e:
+        logger.warning(f"Extract failed for {top_urls}: {str(e)}")
+        raw_contents = {}
+
+    return _attach_raw_content(unique_results, raw_contents)
+
+
+async def afetch_top_raw_content(
+    unique_results: dict, query: str, top_k: int = two_phase_top_k, timeout: float = search_query_timeout
+) -> dict:
+    """Fetch raw content asynchronously for the ``top_k`` results most relevant to ``query``.
+
+    Args:
+        unique_results: Dictionary of unique search results fetched without raw content
+        query: Search query the results were retrieved for
+        top_k: Number of results to fetch raw content for
+        timeout: Timeout in seconds for the extraction call
+
+    Returns:
+        Dictionary of results with raw content for the selected URLs
+    """
+    top_urls = rank_results(unique_results, query)[:top_k]
+    if not top_urls:
+        return unique_results
+
+    try:
+        response = await asyncio.wait_for(get_search_backend().aextract(top_urls), timeout=timeout)
+        raw_contents = {result["url"]: result.get("raw_content") for result in response.get("results", [])}
+    except asyncio.TimeoutError:
+        logger.warning(f"Extract timed out after {timeout}s for {top_urls}")
+        raw_contents = {}
+    except Exception as e:
+        logger.warning(f"Extract failed for {top_urls}: {str(e)}")
+        raw_contents = {}
+
+    return _attach_raw_content(unique_results, raw_contents)
 
 
 def deduplicate_search_results(search_results: List[dict]) -> dict:
@@ -112,32 +343,73 @@ def format_search_output(summarized_results: dict) -> str:
     return formatted_output
 
 
-def process_search_results(unique_results: dict) -> dict:
+def process_search_results(unique_results: dict, max_concurrency: int = max_concurrent_summarizations) -> dict:
     """Process search results by summarizing content where available.
 
+    Pages with raw content are summarized as a batch, at most ``max_concurrency`` at a time.
+
     Args:
         unique_results: Dictionary of unique search results
+        max_concurrency: Maximum number of summarization calls running at the same time
 
     Returns:
-        Dictionary of processed results with summaries
+        Dictionary of processed results with summaries, in the same order as ``unique_results``
     """
-    summarized_results = {}
+    # Summarize raw content for better processing, each page falls back to truncation on failure
+    urls_to_summarize = [url for url, result in unique_results.items() if result.get("raw_content")]
+    summaries = RunnableLambda(summarize_webpage_content).batch(
+        [unique_results[url]["raw_content"] for url in urls_to_summarize],
+        config={"max_concurrency": max_concurrency},
+    )
+    summaries_by_url = dict(zip(urls_to_summarize, summaries))
+
+    # Use existing content if no raw content for summarization
+    return {
+        url: {"title": result["title"], "content": summaries_by_url.get(url, result["content"])}
+        for url, result in unique_results.items()
+    }
+
 
-    for url, result in unique_results.items():
+async def aprocess_search_results(unique_results: dict, max_concurrency: int = max_concurrent_summarizations) -> dict:
+    """Process search results asynchronously, summarizing pages concurrently.
+
+    Inside a URL registry scope, pages already summarized or being summarized by another
+    researcher of the same run are awaited instead of summarized again.
+
+    Args:
+        unique_results: Dictionary of unique search results
+        max_concurrency: Maximum number of summarization calls running at the same time
+
+    Returns:
+        Dictionary of processed results with summaries, in the same order as ``unique_results``
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    url_registry = get_url_registry()
+
+    async def summarize(raw_content: str) -> str:
+        async with semaphore:
+            return await asummarize_webpage_content(raw_content)
+
+    async def process(url: str, result: dict) -> str:
         # Use existing content if no raw content for summarization
         if not result.get("raw_content"):
-            content = result["content"]
-        else:
-            # Summarize raw content for better processing
-            content = summarize_webpage_content(result["raw_content"])
+            return result["content"]
+        if url_registry is None:
+            return await summarize(result["raw_content"])
+        # Near-duplicates of a page seen earlier in the run share its summary
+        return await url_registry.get_or_summarize(
+            result.get("duplicate_of", url), lambda: summarize(result["raw_content"])
+        )
 
-        summarized_results[url] = {"title": result["title"], "content": content}
+    contents = await asyncio.gather(*(process(url, result) for url, result in unique_results.items()))
 
-    return summarized_results
+    return {
+        url: {"title": result["title"], "content": content}
+        for (url, result), content in zip(unique_results.items(), contents)
+    }
 
 
-@tool(parse_docstring=True)
-def tavily_search(
+def _tavily_search(
     query: str,
     max_results: Annotated[int, InjectedToolArg] = 3,
     topic: Annotated[Literal["general", "news", "finance"], InjectedToolArg] = "general",
@@ -152,19 +424,75 @@ def tavily_search(
     Returns:
         Formatted string of search results with summaries
     """
-    # Execute search for single query
+    # Execute search for single query, without raw content in two-phase mode
     search_results = tavily_search_multiple(
         search_queries=[query],
         max_results=max_results,
         topic=topic,
-        include_raw_content=True,
+        include_raw_content=not two_phase_search,
     )
 
     # Deduplicate results by URL to avoid processing duplicate content
     unique_results = deduplicate_search_results(search_results)
 
+    # Two-phase mode: fetch raw content only for the most relevant results
+    if two_phase_search:
+        unique_results = fetch_top_raw_content(unique_results, query)
+
+    # Collapse near-duplicate content
+    unique_results = collapse_near_duplicates(unique_results)
+
+    # Only summarize results relevant to the query, the others keep their search snippet
+    unique_results = filter_relevant_results(unique_results, query)
+
     # Process results with summarization
     summarized_results = process_search_results(unique_results)
 
     # Format output for consumption
     return format_search_output(summarized_results)
+
+
+async def _atavily_search(
+    query: str,
+    max_results: Annotated[int, InjectedToolArg] = 3,
+    topic: Annotated[Literal["general", "news", "finance"], InjectedToolArg] = "general",
+) -> str:
+    """Async entry point of ``tavily_search``, used when the tool is awaited with ``ainvoke``."""
+    # Execute search without blocking the event loop, without raw content in two-phase mode
+    search_results = await atavily_search_multiple(
+        search_queries=[query],
+        max_results=max_results,
+        topic=topic,
+        include_raw_content=not two_phase_search,
+    )
+
+    # Deduplicate results by URL to avoid processing duplicate content
+    unique_results = deduplicate_search_results(search_results)
+
+    # Two-phase mode: fetch raw content only for the most relevant results
+    if two_phase_search:
+        unique_results = await afetch_top_raw_content(unique_results, query)
+
+    # Collapse near-duplicate content within the search and across the run
+    url_registry = get_url_registry()
+    unique_results = collapse_near_duplicates(
+        unique_results, run_index=url_registry.content_index if url_registry is not None else None
+    )
+
+    # Only summarize results relevant to the query, the others keep their search snippet
+    unique_results = filter_relevant_results(unique_results, query)
+
+    # Process results with concurrent summarization
+    summarized_results = await aprocess_search_results(unique_results)
+
+    # Format output for consumption
+    return format_search_output(summarized_results)
+
+
+# Tool exposing both a sync (invoke) and an async (ainvoke) implementation
+tavily_search = StructuredTool.from_function(
+    func=_tavily_search,
+    coroutine=_atavily_search,
+    name="tavily_search",
+    parse_docstring=True,
+)
@@ -0,0 +1,125 @@
+"""Persistent Content-Addressed Cache for Webpage Summaries.
+
+This module implements a SQLite-backed cache placed in front of the webpage
+summarization step. Entries are keyed by a hash of the raw page content, the
+summarization model name and the summarization prompt, so a cache hit can skip
+the LLM call entirely across topics and runs.
+
+The database is opened in WAL mode with a busy timeout, so the worker processes of a
+run can read and write it concurrently.
+"""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+from deep_research import APP_ROOT, config, logger
+from deep_research.consts import summary_cache_busy_timeout, summary_cache_max_bytes, summary_cache_max_entries
+
+
+def _sha256(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8", errors="replace")).hexdigest()
+
+
+class SummaryCache:
+    """Size-bounded SQLite cache with least-recently-used eviction and hit/miss counters."""
+
+    def __init__(
+        self, db_path: str | Path, max_entries: int = summary_cache_max_entries, max_bytes: int = summary_cache_max_bytes
+    ):
+        self.db_path = Path(db_path)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.db_path, timeout=summary_cache_busy_timeout, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS summaries ("
+            "key TEXT PRIMARY KEY, summary TEXT NOT NULL, size INTEGER NOT NULL, last_access REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_summaries_last_access ON summaries (last_access)")
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(webpage_content: str, model_name: str, prompt: str) -> str:
+        """Build the cache key from the raw content, the model name and the prompt template."""
+        return _sha256("\x00".join([_sha256(webpage_content), model_name, _sha256(prompt)]))
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached summary for ``key`` or None, refreshing its recency on a hit."""
+        with self._lock:
+            row = self._conn.execute("SELECT summary FROM summaries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._conn.execute("UPDATE summaries SET last_access = ? WHERE key = ?", (time.time(), key))
+            self._conn.commit()
+            return row[0]
+
+    def set(self, key: str, summary: str) -> None:
+        """Store ``summary`` under ``key`` and evict least recently used entries over the bounds."""
+        size = len(summary.encode("utf-8", errors="replace"))
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO summaries (key, summary, size, last_access) VALUES (?, ?, ?, ?)",
+                (key, summary, size, time.time()),
+            )
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self) -> None:
+        count, total_size = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM summaries").fetchone()
+        if count <= self.max_entries and total_size <= self.max_bytes:
+            return
+
+        # Walk entries from least to most recently used until both bounds are satisfied
+        evicted_keys = []
+        for key, size in self._conn.execute("SELECT key, size FROM summaries ORDER BY last_access ASC"):
+            if count <= self.max_entries and total_size <= self.max_bytes:
+                break
+            evicted_keys.append((key,))
+            count -= 1
+            total_size -= size
+        self._conn.executemany("DELETE FROM summaries WHERE key = ?", evicted_keys)
+        logger.info(f"Summary cache evicted {len(evicted_keys)} entries")
+
+    def stats(self) -> dict:
+        """Return hit/miss counters and current cache occupancy."""
+        with self._lock:
+            count, total_size = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM summaries").fetchone()
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": count,
+            "bytes": total_size,
+        }
+
+    def clear(self) -> None:
+        """Remove every cached summary and reset the counters."""
+        with self._lock:
+            self._conn.execute("DELETE FROM summaries")
+            self._conn.commit()
+            self.hits = 0
+            self.misses = 0
+
+
+# Global cache variable - will be initialized lazily
+_summary_cache = None
+
+
+def get_summary_cache() -> SummaryCache:
+    """Get or initialize the summary cache lazily so the database is only opened when needed."""
+    global _summary_cache
+    if _summary_cache is None:
+        _summary_cache = SummaryCache(APP_ROOT / config.get("Paths", "summary_cache_file"))
+    return _summary_cache
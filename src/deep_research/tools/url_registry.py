@@ -0,0 +1,140 @@
+"""Run-Scoped Registry of Webpage Summaries Shared by Parallel Researchers.
+
+Researchers launched together by the supervisor often retrieve the same URLs.
+This module keeps a registry of URL -> in-flight or finished summary, so a page is
+summarized once per run: concurrent requests for the same URL await a single shared
+task instead of starting a second LLM call. The summarization runs as a task of its own,
+so a researcher cancelled at its deadline does not cancel the summary its siblings await.
+
+A run keeps one registry across all its supervisor iterations, held under a run id until
+the run closes it and reports its totals. The active registry is held in a context
+variable: opening a scope before spawning researchers makes the registry visible to every
+task created inside it.
+"""
+
+import asyncio
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Awaitable, Callable, Iterator, Optional
+
+from deep_research import logger
+from deep_research.tools.near_duplicates import NearDuplicateIndex
+
+
+class UrlRegistry:
+    """Asyncio-safe map of URL to a shared summarization task, with saved-summarization counters.
+
+    The registry also holds the run-wide near-duplicate index, so pages mirroring a page
+    already seen in the run reuse its summary.
+    """
+
+    def __init__(self):
+        self._summaries: dict[str, asyncio.Task] = {}
+        self.content_index = NearDuplicateIndex()
+        self.summarizations_started = 0
+        self.summarizations_saved = 0
+
+    async def get_or_summarize(self, url: str, summarize: Callable[[], Awaitable[str]]) -> str:
+        """Return the summary of ``url``, running ``summarize`` only if no other task already did.
+
+        Args:
+            url: URL of the page to summarize
+            summarize: Coroutine factory producing the summary when the URL is not registered yet
+
+        Returns:
+            Summary of the page, shared by every caller asking for the same URL
+        """
+        task = self._summaries.get(url)
+        if task is not None:
+            self.summarizations_saved += 1
+        else:
+            task = asyncio.ensure_future(summarize())
+            task.add_done_callback(lambda done: self._forget_failed(url, done))
+            self._summaries[url] = task
+            self.summarizations_started += 1
+        # Shield the shared task so a cancelled caller, including the one that started it, does not cancel the others
+        return await asyncio.shield(task)
+
+    def _forget_failed(self, url: str, task: asyncio.Task) -> None:
+        # Forget the URL of a failed summarization so a later request can retry
+        if task.cancelled() or task.exception() is not None:
+            if self._summaries.get(url) is task:
+                del self._summaries[url]
+
+    def stats(self) -> dict:
+        """Return the number of summarizations started and saved in this registry."""
+        return {
+            "urls": len(self._summaries),
+            "summarizations_started": self.summarizations_started,
+            "summarizations_saved": self.summarizations_saved,
+            "near_duplicates": self.content_index.duplicates_found,
+        }
+
+
+_current_registry: ContextVar[Optional[UrlRegistry]] = ContextVar("url_registry", default=None)
+
+# Registries of the runs in progress, by run id
+_run_registries: dict[str, UrlRegistry] = {}
+
+
+def get_url_registry() -> Optional[UrlRegistry]:
+    """Return the registry of the current run scope, or None outside of any scope."""
+    return _current_registry.get()
+
+
+def open_run_url_registry(run_id: Optional[str] = None) -> tuple[str, UrlRegistry]:
+    """Return the registry of run ``run_id``, creating it with a new run id if needed.
+
+    Args:
+        run_id: Id of the run returned by an earlier call, or None to start a new run
+
+    Returns:
+        Run id and registry, the same registry for every call with the same run id
+    """
+    if run_id is None:
+        run_id = uuid.uuid4().hex
+    return run_id, _run_registries.setdefault(run_id, UrlRegistry())
+
+
+def close_run_url_registry(run_id: Optional[str]) -> None:
+    """Drop the registry of run ``run_id`` and log the totals of the run."""
+    registry = _run_registries.pop(run_id, None) if run_id is not None else None
+    if registry is not None:
+        _log_stats(registry)
+
+
+def _log_stats(registry: UrlRegistry) -> None:
+    stats = registry.stats()
+    logger.info(
+        f"URL registry: {stats['summarizations_started']} pages summarized, "
+        f"{stats['summarizations_saved']} summarizations saved across {stats['urls']} URLs, "
+        f"{stats['near_duplicates']} near-duplicate pages"
+    )
+
+
+@contextmanager
+def url_registry_scope(registry: Optional[UrlRegistry] = None) -> Iterator[UrlRegistry]:
+    """Make ``registry`` visible to every task created inside the scope.
+
+    Without a registry, nested scopes reuse the outermost registry, and a new one is
+    opened otherwise and its totals logged when the scope exits.
+
+    Args:
+        registry: Registry of the run, e.g. from ``open_run_url_registry``
+    """
+    current = _current_registry.get()
+    if registry is None and current is not None:
+        yield current
+        return
+
+    owned = registry is None
+    if owned:
+        registry = UrlRegistry()
+    token = _current_registry.set(registry)
+    try:
+        yield registry
+    finally:
+        _current_registry.reset(token)
+        if owned:
+            _log_stats(registry)
@@ -0,0 +1,179 @@
+"""Local Hashed-Feature Vector Index over the Local Research Documents.
+
+Lexical search misses passages phrased differently from the query. This module adds a
+retrieval mode needing no embedding API: every passage of the local document index is
+turned into a fixed-size vector by hashing its words, word bigrams and character
+trigrams into ``vector_dimensions`` signed buckets. Character trigrams make morphological
+variants (e.g. "roaster", "roasting", "roasted") land on shared features.
+
+Vectors are L2-normalized and stored as a float32 NumPy matrix on disk. The matrix is
+opened with a read-only memory map, so worker processes share one copy through the OS
+page cache, and a query is a single matrix-vector product followed by a top-k partition.
+Rows are keyed by passage id, so after a refresh of the lexical index only the new
+passages are vectorized.
+"""
+
+import json
+import os
+import threading
+import zlib
+from pathlib import Path
+from typing import List, Optional
+
+import numpy as np
+
+from deep_research import APP_ROOT, config, logger
+from deep_research.consts import vector_dimensions, vector_min_score
+from deep_research.tools.local_index import LocalDocumentIndex, Passage
+from deep_research.tools.relevance import tokenize
+
+
+def _hashed_features(text: str) -> List[str]:
+    words = tokenize(text)
+    features = [f"w:{word}" for word in words]
+    features += [f"b:{first} {second}" for first, second in zip(words, words[1:])]
+    for word in words:
+        padded = f"#{word}#"
+        features += [f"c:{padded[i : i + 3]}" for i in range(len(padded) - 2)]
+    return features
+
+
+def hashed_vector(text: str, dimensions: int = vector_dimensions) -> np.ndarray:
+    """Compute the L2-normalized hashed feature vector of ``text``.
+
+    Args:
+        text: Passage or query text
+        dimensions: Number of hash buckets
+
+    Returns:
+        float32 array of ``dimensions`` values, all zeros when ``text`` has no features
+    """
+    features = _hashed_features(text)
+    hashes = np.fromiter((zlib.crc32(feature.encode("utf-8")) for feature in features), dtype=np.uint32, count=len(features))
+
+    # The top hash bit gives the sign, so colliding features tend to cancel out instead of adding up
+    signs = np.where(hashes >> 31, -1.0, 1.0)
+    vector = np.bincount(hashes % dimensions, weights=signs, minlength=dimensions).astype(np.float32)
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+
+class HashedVectorIndex:
+    """Memory-mapped matrix of passage vectors, kept in sync with a ``LocalDocumentIndex``.
+
+    The matrix is stored in ``matrix_path`` and the passage of each row in a JSON file
+    next to it. Both are replaced atomically, so readers in other processes keep a valid
+    mapping of the previous matrix until they reload.
+    """
+
+    def __init__(self, matrix_path: str | Path, dimensions: int = vector_dimensions):
+        self.matrix_path = Path(matrix_path)
+        self.metadata_path = self.matrix_path.with_suffix(".json")
+        self.dimensions = dimensions
+        self.matrix = np.zeros((0, dimensions), dtype=np.float32)
+        self.passage_ids: List[int] = []
+        self.passages: List[Passage] = []
+        self.fingerprint: Optional[list[int]] = None
+        self._loaded_mtime_ns: Optional[int] = None
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self) -> None:
+        if not self.matrix_path.exists() or not self.metadata_path.exists():
+            return
+        metadata = json.loads(self.metadata_path.read_text(encoding="utf-8"))
+        if metadata["dimensions"] != self.dimensions or not metadata["passages"]:
+            return
+        matrix = np.load(self.matrix_path, mmap_mode="r")
+        if matrix.shape != (len(metadata["passages"]), self.dimensions):
+            # Another process is halfway through replacing the files
+            return
+        self.matrix = matrix
+        self.passage_ids = [passage_id for passage_id, *_ in metadata["passages"]]
+        self.passages = [Passage(*passage) for _, *passage in metadata["passages"]]
+        self.fingerprint = metadata["fingerprint"]
+        self._loaded_mtime_ns = self.metadata_path.stat().st_mtime_ns
+
+    def sync(self, local_index: LocalDocumentIndex) -> None:
+        """Bring the matrix up to date with the passages of ``local_index``.
+
+        The files are reloaded when another process rebuilt them, and rebuilt when the
+        passages changed since they were written.
+        """
+        with self._lock:
+            if self.metadata_path.exists() and self.metadata_path.stat().st_mtime_ns != self._loaded_mtime_ns:
+                self._load()
+            fingerprint = list(local_index.fingerprint())
+            if fingerprint != self.fingerprint:
+                self._rebuild(local_index, fingerprint)
+
+    def _rebuild(self, local_index: LocalDocumentIndex, fingerprint: list[int]) -> None:
+        previous_rows = {passage_id: row for row, passage_id in enumerate(self.passage_ids)}
+        passages = local_index.iter_passages()
+        matrix = np.zeros((len(passages), self.dimensions), dtype=np.float32)
+        vectorized = 0
+        for row, (passage_id, passage) in enumerate(passages):
+            previous_row = previous_rows.get(passage_id)
+            if previous_row is not None:
+                matrix[row] = self.matrix[previous_row]
+                continue
+            try:
+                matrix[row] = hashed_vector(local_index.read_lines(*passage), self.dimensions)
+            except (OSError, ValueError) as e:
+                # Document deleted since the last refresh, its passage stays a zero vector
+                logger.warning(f"Could not vectorize {passage.path}: {str(e)}")
+            vectorized += 1
+
+        self.matrix_path.parent.mkdir(parents=True, exist_ok=True)
+        matrix_tmp_path = self.matrix_path.with_suffix(".tmp.npy")
+        metadata_tmp_path = self.metadata_path.with_suffix(".tmp.json")
+        np.save(matrix_tmp_path, matrix)
+        metadata_tmp_path.write_text(
+            json.dumps(
+                {
+                    "dimensions": self.dimensions,
+                    "fingerprint": fingerprint,
+                    "passages": [[passage_id, *passage] for passage_id, passage in passages],
+                }
+            ),
+            encoding="utf-8",
+        )
+        os.replace(matrix_tmp_path, self.matrix_path)
+        os.replace(metadata_tmp_path, self.metadata_path)
+        logger.info(f"Vector index rebuilt: {len(passages)} passages, {vectorized} vectorized")
+
+        self.matrix = matrix
+        self.passage_ids = [passage_id for passage_id, _ in passages]
+        self.passages = [passage for _, passage in passages]
+        self.fingerprint = fingerprint
+        self._load()
+
+    def search(self, query: str, max_results: int, min_score: float = vector_min_score) -> List[tuple[Passage, float]]:
+        """Return the passages whose vectors are the most cosine-similar to the vector of ``query``."""
+        query_vector = hashed_vector(query, self.dimensions)
+        with self._lock:
+            matrix, passages = self.matrix, self.passages
+        if not len(passages) or not query_vector.any():
+            return []
+
+        # Rows are unit vectors, so the dot product is the cosine similarity
+        scores = matrix @ query_vector
+        k = min(max_results, len(passages))
+        top_rows = np.argpartition(-scores, k - 1)[:k]
+        top_rows = top_rows[np.argsort(-scores[top_rows])]
+        return [(passages[row], float(scores[row])) for row in top_rows if scores[row] >= min_score]
+
+
+# Global index variable - will be initialized lazily
+_vector_index: Optional[HashedVectorIndex] = None
+_vector_index_lock = threading.Lock()
+
+
+def get_vector_index() -> HashedVectorIndex:
+    """Get or open the persisted vector index, mapping the matrix file read-only."""
+    global _vector_index
+    if _vector_index is None:
+        with _vector_index_lock:
+            if _vector_index is None:
+                _vector_index = HashedVectorIndex(APP_ROOT / config.get("Paths", "local_vectors_file"))
+    return _vector_index
@@ -0,0 +1,109 @@
+"""Reuse of Research Findings across Overlapping ConductResearch Topics.
+
+Across supervisor iterations the supervisor model often re-delegates a topic that an
+earlier researcher of the same run already covered. Before launching a researcher, its
+topic is compared with the topics already researched in the run, read back from the
+supervisor messages, and the existing compressed findings are reused when the overlap is
+above a threshold.
+
+Overlap is the share of the new topic's terms covered by a finished topic, each term
+weighted by its IDF over the topics of the run. Terms shared by every topic (e.g. "coffee",
+"San Francisco") weigh little, while a term only found in the new topic (e.g. the name of
+another coffee shop) weighs a lot, so a narrower or reworded topic is reused but a topic
+about a different entity is not.
+
+The threshold is read from the ``topic_reuse_threshold`` configurable of the run config,
+falling back to ``consts.py``.
+"""
+
+from typing import NamedTuple, Optional, Sequence
+
+from langchain_core.messages import AIMessage, BaseMessage, ToolMessage
+from langchain_core.runnables import RunnableConfig
+
+from deep_research.consts import topic_reuse_threshold
+from deep_research.tools.relevance import BM25, tokenize
+
+# Prefix of the findings reused for an overlapping topic
+REUSED_FINDINGS_NOTE = (
+    "[Reused findings: this topic overlaps ({score:.0%}) with an earlier research topic of this run, so its findings are "
+    "returned instead of researching again. Delegate a narrower topic for anything they do not cover.]\n"
+    "Earlier topic: {research_topic}\n\n"
+)
+
+
+class FinishedResearch(NamedTuple):
+    """Topic of a researcher that completed in this run, with its compressed findings."""
+
+    research_topic: str
+    findings: str
+
+
+class TopicMatch(NamedTuple):
+    """Finished research overlapping a new topic, and the overlap score."""
+
+    research: FinishedResearch
+    score: float
+
+
+def reuse_threshold(config: Optional[RunnableConfig]) -> float:
+    """Return the overlap above which findings are reused, from the run config."""
+    return (config or {}).get("configurable", {}).get("topic_reuse_threshold", topic_reuse_threshold)
+
+
+def finished_research(messages: Sequence[BaseMessage]) -> list[FinishedResearch]:
+    """Return the topics and findings of the researchers that completed in the supervisor messages.
+
+    Researchers that failed or were stopped at their deadline, and findings that were
+    themselves reused, are left out.
+    """
+    topics = {
+        tool_call["id"]: tool_call["args"]["research_topic"]
+        for message in messages
+        if isinstance(message, AIMessage)
+        for tool_call in message.tool_calls
+        if tool_call["name"] == "ConductResearch"
+    }
+    return [
+        FinishedResearch(topics[message.tool_call_id], message.content)
+        for message in messages
+        if isinstance(message, ToolMessage)
+        and message.tool_call_id in topics
+        and message.status != "error"
+        and not (isinstance(message.artifact, dict) and ("reused_from" in message.artifact or message.artifact.get("timed_out")))
+    ]
+
+
+def topic_overlap(research_topic: str, finished_topics: Sequence[str]) -> list[float]:
+    """Return the IDF-weighted share of the terms of ``research_topic`` covered by each finished topic.
+
+    Args:
+        research_topic: Topic about to be delegated
+        finished_topics: Topics already researched
+
+    Returns:
+        Overlap in [0, 1] with each finished topic, in the order of ``finished_topics``
+    """
+    terms = [set(tokenize(topic)) for topic in [*finished_topics, research_topic]]
+    idf = BM25([list(topic_terms) for topic_terms in terms]).idf
+    new_terms = terms[-1]
+    total_weight = sum(idf[term] for term in new_terms)
+    if not total_weight:
+        return [0.0] * len(finished_topics)
+    return [sum(idf[term] for term in new_terms & topic_terms) / total_weight for topic_terms in terms[:-1]]
+
+
+def match_finished_research(
+    research_topic: str, finished: Sequence[FinishedResearch], threshold: float = topic_reuse_threshold
+) -> Optional[TopicMatch]:
+    """Return the finished research overlapping ``research_topic`` the most, if above ``threshold``."""
+    if not finished:
+        return None
+    scores = topic_overlap(research_topic, [research.research_topic for research in finished])
+    best = max(range(len(finished)), key=scores.__getitem__)
+    return TopicMatch(finished[best], scores[best]) if scores[best] >= threshold else None
+
+
+def reused_findings(match: TopicMatch) -> str:
+    """Return the tool message content reusing the findings of ``match``."""
+    return REUSED_FINDINGS_NOTE.format(score=match.score, research_topic=match.research.research_topic) + match.research.findings
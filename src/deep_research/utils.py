@@ -1,7 +1,8 @@
+import multiprocessing
 import os
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Sequence
 
 from langchain.chat_models import init_chat_model
 
@@ -22,6 +23,27 @@ def get_current_dir() -> Path:
         return Path.cwd()
 
 
+def worker_process_context(preload: Sequence[str] = ()) -> multiprocessing.context.BaseContext:
+    """Get the multiprocessing context used to start worker processes.
+
+    Workers are forked from a clean fork server, so they start quickly without inheriting the
+    threads (logging, executors) and open connections (SQLite) of the parent process, whose
+    locks could deadlock a plain fork. Platforms without a fork server spawn workers instead.
+
+    The fork server is shared by every pool of the process and keeps the preload it was
+    started with, a later pool's workers import their modules on first use. The entry script
+    is never preloaded, so its top-level code does not run in the fork server.
+
+    Args:
+        preload: Modules imported once by the fork server, e.g. the module of the worker function
+    """
+    if "forkserver" not in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("spawn")
+    context = multiprocessing.get_context("forkserver")
+    context.set_forkserver_preload(list(preload))
+    return context
+
+
 def create_model(model_name: str, temperature: float = 0.0, max_tokens: Optional[int] = None, **kwargs):
     """Create a model instance based on the model name with appropriate configuration.
 
@@ -9,11 +9,8 @@ from deep_research.format_utils import format_messages
 from deep_research.graphs.research_agent_full import deep_researcher_builder
 from deep_research.utils import get_current_dir
 
-current_dir = get_current_dir()
 checkpointer = InMemorySaver()
 full_agent = deep_researcher_builder.compile(checkpointer=checkpointer)
-full_agent.get_graph().print_ascii()
-full_agent.get_graph(xray=True).draw_mermaid_png(output_file_path=f"{current_dir}/images/full_agent.png")
 
 
 async def main(research_topic: str, follow_up: str):
@@ -31,6 +28,10 @@ async def main(research_topic: str, follow_up: str):
 
 
 if __name__ == "__main__":
+    current_dir = get_current_dir()
+    full_agent.get_graph().print_ascii()
+    full_agent.get_graph(xray=True).draw_mermaid_png(output_file_path=f"{current_dir}/images/full_agent.png")
+
     research_topic = "Compare Gemini to OpenAI Deep Research agents."
     follow_up = "Yes the specific Deep Research products."
     asyncio.run(main(research_topic=research_topic, follow_up=follow_up))
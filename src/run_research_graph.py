@@ -1,18 +1,17 @@
+import asyncio
 import time
 
 from langchain_core.messages import HumanMessage
 
 from deep_research.format_utils import format_messages, show_prompt
 from deep_research.graphs.research_agent import researcher_agent
+from deep_research.prompt_caching import prompt_cache_stats
 from deep_research.prompts import research_agent_prompt
+from deep_research.research_budget import ResearchBudget
 from deep_research.utils import get_current_dir
 
-show_prompt(research_agent_prompt, "Research Agent Instructions")
 
-current_dir = get_current_dir()
-researcher_agent.get_graph(xray=True).draw_mermaid_png(output_file_path=f"{current_dir}/images/researcher_agent.png")
-
-if __name__ == "__main__":
+async def main():
     from uuid import uuid4
 
     thread_id = uuid4()
@@ -21,6 +20,7 @@ if __name__ == "__main__":
         "configurable": {"thread_id": thread_id},
         "run_name": f'research_workflow_{time.strftime("%m-%d-%Hh%M", time.localtime())}',
     }
+    thread["metadata"] = ResearchBudget.from_config(thread).as_metadata()
     # Example brief
     research_brief = """I want to identify and evaluate the coffee shops in San Francisco that are considered the best based specifically
     on coffee quality. My research should focus on analyzing and comparing coffee shops within the San Francisco area,
@@ -33,6 +33,17 @@ if __name__ == "__main__":
     the top coffee shops in San Francisco, emphasizing their coffee quality according to the latest available data as
     of July 2025."""
 
-    result = researcher_agent.invoke({"researcher_messages": [HumanMessage(content=f"{research_brief}.")]}, config=thread)
+    result = await researcher_agent.ainvoke({"researcher_messages": [HumanMessage(content=f"{research_brief}.")]}, config=thread)
     format_messages(result["researcher_messages"])
     print(result["compressed_research"])
+    print(result["research_budget"])
+    print(prompt_cache_stats())
+
+
+if __name__ == "__main__":
+    show_prompt(research_agent_prompt, "Research Agent Instructions")
+
+    current_dir = get_current_dir()
+    researcher_agent.get_graph(xray=True).draw_mermaid_png(output_file_path=f"{current_dir}/images/researcher_agent.png")
+
+    asyncio.run(main())
@@ -6,13 +6,15 @@ from langchain_core.messages import HumanMessage
 from deep_research.format_utils import format_messages, show_prompt
 from deep_research.graphs.research_agent_mcp import agent_mcp
 from deep_research.prompts import research_agent_prompt_with_mcp
-
-show_prompt(research_agent_prompt_with_mcp, "Research Agent Instructions")
+from deep_research.tools import reset_mcp_client, start_mcp_pool
 
 
 async def main():
     from uuid import uuid4
 
+    # Start the MCP servers once, before the first research call
+    mcp_pool = await start_mcp_pool()
+
     thread_id = uuid4()
     print(f"\nresearch agent {thread_id}")
     thread = {
@@ -31,10 +33,17 @@ async def main():
     the top coffee shops in San Francisco, emphasizing their coffee quality according to the latest available data as
     of July 2025."""
 
-    result = await agent_mcp.ainvoke({"researcher_messages": [HumanMessage(content=f"{research_brief}.")]}, config=thread)
-    format_messages(result["researcher_messages"])
-    print(result["compressed_research"])
+    try:
+        result = await agent_mcp.ainvoke({"researcher_messages": [HumanMessage(content=f"{research_brief}.")]}, config=thread)
+        format_messages(result["researcher_messages"])
+        print(result["compressed_research"])
+        print(f"MCP pool stats: {mcp_pool.stats()}")
+    finally:
+        # Stop the MCP servers of the pool
+        await reset_mcp_client()
 
 
 if __name__ == "__main__":
+    show_prompt(research_agent_prompt_with_mcp, "Research Agent Instructions")
+
     asyncio.run(main())
@@ -0,0 +1,39 @@
+"""Micro-benchmark of the per-call overhead removed by the runnable registry.
+
+Compares building the tool-bound research model and the structured summarization model
+on every call, as the research loop used to do, with fetching them from the registry.
+No model is invoked, so no API call is made.
+"""
+
+import timeit
+
+from deep_research.chains import research_model, scoping_model, summarization_model
+from deep_research.chains.runnable_registry import get_model_with_tools, get_structured_model
+from deep_research.nodes.research_llm_call_node import tools
+from deep_research.states.state_research import Summary
+from deep_research.states.state_scope import ClarifyWithUser
+
+NUMBER = 200
+
+cases = {
+    "research_model.bind_tools(tools)": (
+        lambda: research_model.bind_tools(tools),
+        lambda: get_model_with_tools(research_model, tools),
+    ),
+    "summarization_model.with_structured_output(Summary)": (
+        lambda: summarization_model.with_structured_output(Summary),
+        lambda: get_structured_model(summarization_model, Summary),
+    ),
+    "scoping_model.with_structured_output(ClarifyWithUser)": (
+        lambda: scoping_model.with_structured_output(ClarifyWithUser),
+        lambda: get_structured_model(scoping_model, ClarifyWithUser),
+    ),
+}
+
+if __name__ == "__main__":
+    print(f"{'runnable':<56}{'rebuilt (us/call)':>20}{'registry (us/call)':>20}{'speedup':>10}")
+    for name, (rebuild, registry) in cases.items():
+        registry()  # The first registry call builds the runnable, like the first research iteration
+        rebuild_us = timeit.timeit(rebuild, number=NUMBER) / NUMBER * 1e6
+        registry_us = timeit.timeit(registry, number=NUMBER) / NUMBER * 1e6
+        print(f"{name:<56}{rebuild_us:>20.1f}{registry_us:>20.2f}{rebuild_us / registry_us:>9.0f}x")
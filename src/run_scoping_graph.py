@@ -11,11 +11,12 @@ from deep_research.utils import get_current_dir
 
 checkpointer = InMemorySaver()
 scope = deep_researcher_builder.compile(checkpointer=checkpointer)
-scope.get_graph().print_ascii()
-current_dir = get_current_dir()
-scope.get_graph(xray=True).draw_mermaid_png(output_file_path=f"{current_dir}/images/scoping_agent.png")
 
 if __name__ == "__main__":
+    scope.get_graph().print_ascii()
+    current_dir = get_current_dir()
+    scope.get_graph(xray=True).draw_mermaid_png(output_file_path=f"{current_dir}/images/scoping_agent.png")
+
     from uuid import uuid4
 
     thread_id = uuid4()
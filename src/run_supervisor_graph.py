@@ -6,12 +6,9 @@ from langchain_core.messages import HumanMessage
 
 from deep_research.format_utils import format_messages
 from deep_research.graphs.multi_agent_supervisor import supervisor_agent
+from deep_research.prompt_caching import prompt_cache_stats
 from deep_research.utils import get_current_dir
 
-current_dir = get_current_dir()
-supervisor_agent.get_graph().print_ascii()
-supervisor_agent.get_graph(xray=True).draw_mermaid_png(output_file_path=f"{current_dir}/images/supervisor.png")
-
 
 async def main():
     thread_id = uuid4()
@@ -34,7 +31,13 @@ async def main():
 
     result = await supervisor_agent.ainvoke({"supervisor_messages": [HumanMessage(content=f"{research_brief}.")]}, config=thread)
     format_messages(result["supervisor_messages"])
+    print(f"Researchers avoided by reusing findings: {result.get('researchers_avoided', 0)}")
+    print(prompt_cache_stats())
 
 
 if __name__ == "__main__":
+    current_dir = get_current_dir()
+    supervisor_agent.get_graph().print_ascii()
+    supervisor_agent.get_graph(xray=True).draw_mermaid_png(output_file_path=f"{current_dir}/images/supervisor.png")
+
     asyncio.run(main())
@@ -0,0 +1,12 @@
+"""Shared test configuration.
+
+The model clients are created when the graphs are imported but never called by the tests,
+so placeholder credentials are enough.
+"""
+
+import os
+
+os.environ.setdefault("MODEL_PROVIDER", "openai_anthropic")
+os.environ.setdefault("OPENAI_API_KEY", "test")
+os.environ.setdefault("ANTHROPIC_API_KEY", "test")
+os.environ.setdefault("TAVILY_API_KEY", "test")
@@ -0,0 +1,24 @@
+"""Smoke tests of the local document search tools over the bundled research documents."""
+
+import pytest
+
+from deep_research.tools import local_index, vector_index
+from deep_research.tools.local_index import LocalDocumentIndex
+from deep_research.tools.local_search_tools import search_local_documents, semantic_search_local_documents
+from deep_research.tools.vector_index import HashedVectorIndex
+
+
+@pytest.fixture(autouse=True)
+def isolated_indexes(monkeypatch, tmp_path):
+    monkeypatch.setattr(local_index, "_local_index", LocalDocumentIndex())
+    monkeypatch.setattr(vector_index, "_vector_index", HashedVectorIndex(tmp_path / "vectors.npy"))
+
+
+def test_search_local_documents_formats_passages():
+    output = search_local_documents.invoke({"query": "coffee"})
+    assert "--- PASSAGE 1: coffee_shops_sf.md (lines" in output
+
+
+def test_semantic_search_local_documents_formats_passages():
+    output = semantic_search_local_documents.invoke({"query": "coffee roasting"})
+    assert "--- PASSAGE 1: coffee_shops_sf.md (lines" in output
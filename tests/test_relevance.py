@@ -0,0 +1,29 @@
+"""Tests of the BM25 relevance pre-filter of search results."""
+
+from deep_research.tools.relevance import filter_relevant_results
+
+ON_TOPIC_PAGES = [
+    "The best coffee shops San Francisco has to offer: Sightglass, Ritual and Blue Bottle serve excellent espresso.",
+    "Guide to the best coffee shops San Francisco locals love, from Mission cafes to North Beach roasters.",
+    "Our list of the best coffee shops San Francisco visitors should try, with notes on roast and pastries.",
+]
+
+
+def search_results(pages: list[str]) -> dict:
+    return {f"https://example.com/{i}": {"title": "", "content": "", "raw_content": page} for i, page in enumerate(pages)}
+
+
+def summarized_urls(results: dict) -> list[str]:
+    return [url for url, result in results.items() if result["raw_content"]]
+
+
+def test_query_terms_missing_from_every_page_do_not_filter_on_topic_pages():
+    results = search_results(ON_TOPIC_PAGES)
+    query = "best coffee shops San Francisco coffee quality expert ratings 2025"
+    assert summarized_urls(filter_relevant_results(results, query)) == list(results)
+
+
+def test_off_topic_pages_are_filtered_except_the_top_ranked_one():
+    results = search_results(["Recipe for banana bread with walnuts.", "Stock market news of the day.", *ON_TOPIC_PAGES[:1]])
+    assert summarized_urls(filter_relevant_results(results, "best coffee shops San Francisco")) == ["https://example.com/2"]
+    assert len(summarized_urls(filter_relevant_results(results, "best quantum computing startups", threshold=0.5))) == 1
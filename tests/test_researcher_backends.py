@@ -0,0 +1,55 @@
+"""Tests of the researcher jobs run by worker processes."""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+from deep_research import researcher_backends
+from deep_research.researcher_backends import ResearcherJob, execute_job_payload
+
+
+class _OkHandler(BaseHTTPRequestHandler):
+    # Keep connections open, so the client pools them across jobs
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _OkHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/"
+    server.shutdown()
+
+
+def test_jobs_of_a_worker_share_long_lived_async_clients(monkeypatch, server_url):
+    # Like the search and model clients, the HTTP client is created by the first job and reused by the next ones
+    clients = []
+
+    async def run_researcher_with_retry(research_topic, *args):
+        if not clients:
+            clients.append(httpx.AsyncClient())
+        response = await clients[0].get(server_url)
+        return {"compressed_research": f"{research_topic}: {response.text}", "raw_notes": [], "attempts": 1}
+
+    monkeypatch.setattr(researcher_backends, "run_researcher_with_retry", run_researcher_with_retry)
+    monkeypatch.setattr(researcher_backends, "_worker_loop", None)
+
+    for research_topic in ["first topic", "second topic"]:
+        result = researcher_backends._decode(execute_job_payload(ResearcherJob(research_topic).to_bytes()))
+        assert result == {"compressed_research": f"{research_topic}: ok", "raw_notes": [], "attempts": 1}
+
+    worker_loop = researcher_backends.get_worker_loop()
+    worker_loop.run_until_complete(clients[0].aclose())
+    worker_loop.close()
@@ -0,0 +1,41 @@
+"""Tests of the retries of failing researcher jobs."""
+
+import asyncio
+
+from deep_research import researcher_jobs
+from deep_research.researcher_jobs import run_researcher_with_retry
+
+
+def failing_researcher(failures: list[BaseException]):
+    calls = []
+
+    async def run_researcher(*args) -> dict:
+        calls.append(args)
+        if len(calls) <= len(failures):
+            raise failures[len(calls) - 1]
+        return {"compressed_research": "findings", "raw_notes": [], "timed_out": False, "seconds": 0.0}
+
+    return run_researcher, calls
+
+
+def test_failing_researcher_is_retried_until_it_succeeds(monkeypatch):
+    run_researcher, calls = failing_researcher([RuntimeError("rate limited"), asyncio.CancelledError()])
+    monkeypatch.setattr(researcher_jobs, "run_researcher", run_researcher)
+
+    result = asyncio.run(run_researcher_with_retry("coffee", max_attempts=3, base_delay=0))
+
+    assert result["compressed_research"] == "findings"
+    assert result["attempts"] == 3
+    assert len(calls) == 3
+
+
+def test_researcher_failing_every_attempt_returns_an_error_result(monkeypatch):
+    run_researcher, calls = failing_researcher([RuntimeError("rate limited")] * 3)
+    monkeypatch.setattr(researcher_jobs, "run_researcher", run_researcher)
+
+    result = asyncio.run(run_researcher_with_retry("coffee", max_attempts=3, base_delay=0))
+
+    assert result["error"] == {"type": "RuntimeError", "message": "rate limited", "attempts": 3}
+    assert result["attempts"] == 3
+    assert result["compressed_research"] == ""
+    assert len(calls) == 3
@@ -0,0 +1,45 @@
+"""Tests of the bounded FIFO scheduler running the researchers of the supervisor."""
+
+import asyncio
+
+import pytest
+
+from deep_research.researcher_scheduler import ResearcherScheduler
+
+
+def test_jobs_start_in_fifo_order_within_the_concurrency_limit():
+    started = []
+    running = 0
+    peak_running = 0
+
+    def job(index: int):
+        async def run() -> int:
+            nonlocal running, peak_running
+            started.append(index)
+            running += 1
+            peak_running = max(peak_running, running)
+            await asyncio.sleep(0.01 * (index % 3 + 1))
+            running -= 1
+            return index
+
+        return run
+
+    results = asyncio.run(ResearcherScheduler(3).run([job(index) for index in range(8)]))
+
+    assert results == list(range(8))
+    assert started == list(range(8))
+    assert peak_running == 3
+
+
+def test_job_raising_cancelled_error_is_raised_to_the_consumer():
+    async def cancelled_job():
+        raise asyncio.CancelledError()
+
+    async def finished_job():
+        return "findings"
+
+    async def consume() -> list:
+        return [result async for result in ResearcherScheduler(2).as_completed([finished_job, cancelled_job])]
+
+    with pytest.raises(RuntimeError, match="cancelled"):
+        asyncio.run(asyncio.wait_for(consume(), timeout=5))
@@ -0,0 +1,53 @@
+"""Tests of the registry sharing page summaries between the researchers of a run."""
+
+import asyncio
+
+from deep_research.tools.url_registry import UrlRegistry, close_run_url_registry, open_run_url_registry
+
+
+def test_cancelled_caller_does_not_cancel_the_shared_summary():
+    async def summarize() -> str:
+        await asyncio.sleep(0.05)
+        return "summary"
+
+    async def main():
+        registry = UrlRegistry()
+        first = asyncio.create_task(registry.get_or_summarize("https://example.com", summarize))
+        second = asyncio.create_task(registry.get_or_summarize("https://example.com", summarize))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        assert await second == "summary"
+        assert first.cancelled()
+        assert registry.summarizations_started == 1
+        assert registry.summarizations_saved == 1
+
+    asyncio.run(main())
+
+
+def test_failed_summary_is_retried_by_a_later_request():
+    attempts = []
+
+    async def summarize() -> str:
+        attempts.append(len(attempts))
+        if len(attempts) == 1:
+            raise RuntimeError("rate limited")
+        return "summary"
+
+    async def main():
+        registry = UrlRegistry()
+        try:
+            await registry.get_or_summarize("https://example.com", summarize)
+        except RuntimeError:
+            pass
+        assert await registry.get_or_summarize("https://example.com", summarize) == "summary"
+        assert len(attempts) == 2
+
+    asyncio.run(main())
+
+
+def test_run_registry_is_shared_until_the_run_closes_it():
+    run_id, registry = open_run_url_registry()
+    assert open_run_url_registry(run_id) == (run_id, registry)
+    close_run_url_registry(run_id)
+    assert open_run_url_registry(run_id)[1] is not registry
+    close_run_url_registry(run_id)